@@ -1,3 +1,4 @@
+# ruff: noqa: TCH004
 """This packages provides infrastructure for running a proactor on top of asyncio with support multiple MQTT clients
 and and sub-objects which support their own threads for synchronous operations.
 
@@ -15,29 +16,61 @@ Particular questions:
 * Test support should be implemented / cleaner.
 """
 
-from gwproactor.actors import Actor, SyncThreadActor, SyncThreadT
-from gwproactor.config import ProactorSettings
-from gwproactor.external_watchdog import ExternalWatchdogCommandBuilder
-from gwproactor.links.mqtt import QOS, MQTTClients, MQTTClientWrapper, Subscription
-from gwproactor.logger import ProactorLogger
-from gwproactor.logging_setup import format_exceptions, setup_logging
-from gwproactor.proactor_implementation import Proactor
-from gwproactor.proactor_interface import (
-    INVALID_IO_TASK_HANDLE,
-    ActorInterface,
-    Communicator,
-    CommunicatorInterface,
-    MonitoredName,
-    Runnable,
-    ServicesInterface,
-)
-from gwproactor.problems import Problems
-from gwproactor.sync_thread import (
-    AsyncQueueWriter,
-    SyncAsyncInteractionThread,
-    SyncAsyncQueueWriter,
-    responsive_sleep,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gwproactor.actors import Actor, SyncThreadActor, SyncThreadT
+    from gwproactor.config import ProactorSettings
+    from gwproactor.external_watchdog import ExternalWatchdogCommandBuilder
+    from gwproactor.links.mqtt import QOS, MQTTClients, MQTTClientWrapper, Subscription
+    from gwproactor.logger import ProactorLogger
+    from gwproactor.logging_setup import format_exceptions, setup_logging
+    from gwproactor.proactor_implementation import Proactor
+    from gwproactor.proactor_interface import (
+        INVALID_IO_TASK_HANDLE,
+        ActorInterface,
+        Communicator,
+        CommunicatorInterface,
+        MonitoredName,
+        Runnable,
+        ServicesInterface,
+    )
+    from gwproactor.problems import Problems
+    from gwproactor.sync_thread import (
+        AsyncQueueWriter,
+        SyncAsyncInteractionThread,
+        SyncAsyncQueueWriter,
+        responsive_sleep,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "Actor": "gwproactor.actors",
+    "SyncThreadActor": "gwproactor.actors",
+    "SyncThreadT": "gwproactor.actors",
+    "ProactorSettings": "gwproactor.config",
+    "ExternalWatchdogCommandBuilder": "gwproactor.external_watchdog",
+    "MQTTClientWrapper": "gwproactor.links.mqtt",
+    "MQTTClients": "gwproactor.links.mqtt",
+    "QOS": "gwproactor.links.mqtt",
+    "Subscription": "gwproactor.links.mqtt",
+    "ProactorLogger": "gwproactor.logger",
+    "format_exceptions": "gwproactor.logging_setup",
+    "setup_logging": "gwproactor.logging_setup",
+    "Proactor": "gwproactor.proactor_implementation",
+    "ActorInterface": "gwproactor.proactor_interface",
+    "Communicator": "gwproactor.proactor_interface",
+    "CommunicatorInterface": "gwproactor.proactor_interface",
+    "INVALID_IO_TASK_HANDLE": "gwproactor.proactor_interface",
+    "MonitoredName": "gwproactor.proactor_interface",
+    "Runnable": "gwproactor.proactor_interface",
+    "ServicesInterface": "gwproactor.proactor_interface",
+    "Problems": "gwproactor.problems",
+    "AsyncQueueWriter": "gwproactor.sync_thread",
+    "SyncAsyncInteractionThread": "gwproactor.sync_thread",
+    "SyncAsyncQueueWriter": "gwproactor.sync_thread",
+    "responsive_sleep": "gwproactor.sync_thread",
+}
 
 __all__ = [
     "INVALID_IO_TASK_HANDLE",
@@ -66,3 +99,18 @@ __all__ = [
     "responsive_sleep",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public names of this package on first access (PEP 562), so that importing gwproactor, or one of
+    its light-weight submodules, does not pay for importing paho-mqtt, aiohttp, etc."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Optional
 
 import aiohttp
+import orjson
 import yarl
 from aiohttp import ClientResponse, ClientSession, ClientTimeout
 from gwproto import Message
@@ -15,17 +16,40 @@ from gwproto.data_classes.components.rest_poller_component import RESTPollerComp
 from gwproto.type_helpers import AioHttpClientTimeout, RESTPollerSettings, URLConfig
 from result import Result
 
+try:
+    import aiodns  # noqa: F401
+except ImportError:
+    _AIODNS_INSTALLED = False
+else:
+    _AIODNS_INSTALLED = True
+
 from gwproactor import Actor, Problems, ServicesInterface
 from gwproactor.proactor_interface import INVALID_IO_TASK_HANDLE, IOLoopInterface
 
 Converter = Callable[[ClientResponse], Awaitable[Optional[Message]]]
+BytesConverter = Callable[[bytes], Awaitable[Optional[Message]]]
 ThreadSafeForwarder = Callable[[Message], Any]
+ThreadSafeBatchForwarder = Callable[[list[Message]], Any]
+
+
+def json_dumps(obj: Any) -> str:
+    """orjson-backed replacement for json.dumps, used as the poller session's json_serialize."""
+    return orjson.dumps(obj).decode()
+
+
+# orjson-backed replacement for json.loads. Converters should decode with
+# `await response.json(loads=json_loads)` rather than with the stdlib default.
+json_loads = orjson.loads
 
 
 async def null_converter(_response: ClientResponse) -> Optional[Message]:
     return None
 
 
+async def null_bytes_converter(_body: bytes) -> Optional[Message]:
+    return None
+
+
 def null_forwarder(_message: Message) -> None:
     return None
 
@@ -38,13 +62,13 @@ def to_client_timeout(
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionArgs:
     base_url: Optional[yarl.URL] = None
     kwargs: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestArgs:
     method: str = "GET"
     url: Optional[yarl.URL] = None
@@ -52,14 +76,27 @@ class RequestArgs:
 
 
 class RESTPoller:
+    CONNECTION_LIMIT: int = 1
+    KEEPALIVE_MARGIN_SECONDS: float = 15.0
+    MAX_KEEPALIVE_SECONDS: float = 60.0
+    DNS_CACHE_TTL_SECONDS: int = 300
+
     _name: str
     _rest: RESTPollerSettings
     _io_loop_manager: IOLoopInterface
     _task_id: int
     _session_args: Optional[SessionArgs] = None
     _request_args: Optional[RequestArgs] = None
+    _session_kwargs: Optional[dict] = None
+    _request_kwargs: Optional[dict] = None
     _converter: Converter
+    _bytes_converter: BytesConverter
     _forward: ThreadSafeForwarder
+    _forward_batch: Optional[ThreadSafeBatchForwarder] = None
+    _batch_size: int = 1
+    _batch_max_delay_seconds: float = 0.0
+    _pending: list[Message]
+    _flush_handle: Optional[asyncio.TimerHandle] = None
 
     def __init__(  # noqa: PLR0913
         self,
@@ -70,14 +107,54 @@ class RESTPoller:
         convert: Converter = null_converter,
         forward: ThreadSafeForwarder = null_forwarder,
         cache_request_args: bool = True,
+        forward_batch: Optional[ThreadSafeBatchForwarder] = None,
+        batch_size: int = 1,
+        batch_max_delay_seconds: Optional[float] = None,
+        convert_bytes: Optional[BytesConverter] = None,
     ) -> None:
+        """
+        Args:
+            convert_bytes: Optional converter which receives the whole response body, read with a single
+                response.read(), instead of the ClientResponse. Suited to small payloads. If present, convert is
+                ignored.
+            forward_batch: Optional thread-safe function which forwards a list of messages with a single cross-thread
+                hand-off, e.g. ServicesInterface.send_threadsafe_batch. Only used if batch_size > 1.
+            batch_size: Converted messages are accumulated and forwarded together once this many are pending.
+            batch_max_delay_seconds: Pending messages are forwarded once the oldest has waited this long, even if
+                fewer than batch_size are pending. The flush is scheduled on the event loop when the first message
+                is buffered, so it does not wait for the next poll. Required if batch_size > 1. A poll produces at
+                most one message, so this must exceed poll_period_seconds * (batch_size - 1) for a full batch to
+                be possible; every batched message may be delayed by up to this long. ValueError is raised otherwise.
+        """
         self._name = name
         self._task_id = INVALID_IO_TASK_HANDLE
         self._rest = rest
         self._io_loop_manager = loop_manager
-        self._convert = convert
+        self._converter = convert
+        self._bytes_converter = null_bytes_converter
+        if convert_bytes is not None:
+            self._bytes_converter = convert_bytes
+            self._converter = self._convert_body
         self._forward = forward
+        if forward_batch is not None and batch_size > 1:
+            if batch_max_delay_seconds is None:
+                raise ValueError(
+                    f"ERROR. RESTPoller <{name}>: batch_max_delay_seconds is required when batch_size > 1"
+                )
+            min_delay_seconds = rest.poll_period_seconds * (batch_size - 1)
+            if batch_max_delay_seconds <= min_delay_seconds:
+                raise ValueError(
+                    f"ERROR. RESTPoller <{name}>: batch_max_delay_seconds ({batch_max_delay_seconds}) must exceed "
+                    f"poll_period_seconds * (batch_size - 1) ({min_delay_seconds}), since each poll produces at "
+                    "most one message"
+                )
+            self._forward_batch = forward_batch
+            self._batch_size = batch_size
+            self._batch_max_delay_seconds = batch_max_delay_seconds
+        self._pending = []
         if cache_request_args:
+            self._session_kwargs = self._make_session_kwargs()
+            self._request_kwargs = self._make_request_kwargs()
             self._session_args = self._make_session_args()
             self._request_args = self._make_request_args()
 
@@ -87,99 +164,153 @@ class RESTPoller:
     def _make_url(self) -> Optional[yarl.URL]:
         return URLConfig.make_url(self._rest.request.url)
 
-    def _make_session_args(self) -> SessionArgs:
-        return SessionArgs(
-            self._make_base_url(),
-            dict(
-                self._rest.session.model_dump(
-                    exclude={"base_url", "timeout"},
-                    exclude_unset=True,
-                ),
-                timeout=to_client_timeout(self._rest.session.timeout),
+    def _make_session_kwargs(self) -> dict:
+        return dict(
+            self._rest.session.model_dump(
+                exclude={"base_url", "timeout"},
+                exclude_unset=True,
             ),
+            timeout=to_client_timeout(self._rest.session.timeout),
+            json_serialize=json_dumps,
         )
 
+    def _make_request_kwargs(self) -> dict:
+        return dict(
+            self._rest.request.model_dump(
+                exclude={"method", "url", "timeout"},
+                exclude_unset=True,
+            ),
+            timeout=to_client_timeout(self._rest.request.timeout),
+        )
+
+    def _make_session_args(self) -> SessionArgs:
+        if self._session_kwargs is None:
+            kwargs = self._make_session_kwargs()
+        else:
+            kwargs = dict(self._session_kwargs)
+        return SessionArgs(self._make_base_url(), kwargs)
+
     def _make_request_args(self) -> RequestArgs:
-        return RequestArgs(
-            self._rest.request.method,
-            self._make_url(),
-            dict(
-                self._rest.request.model_dump(
-                    exclude={"method", "url", "timeout"},
-                    exclude_unset=True,
-                ),
-                timeout=to_client_timeout(self._rest.request.timeout),
+        if self._request_kwargs is None:
+            kwargs = self._make_request_kwargs()
+        else:
+            kwargs = dict(self._request_kwargs)
+        return RequestArgs(self._rest.request.method, self._make_url(), kwargs)
+
+    def _make_connector(self) -> aiohttp.TCPConnector:
+        """Create the connection pool for the poller's session.
+
+        Requests are made one at a time, so the pool is small. The keepalive timeout spans the poll period, so the
+        connection (and its TLS session) is reused from one poll to the next instead of being re-established for
+        each request. It is capped at MAX_KEEPALIVE_SECONDS, below common server idle timeouts, so that pollers
+        with long poll periods do not reuse connections the server has already closed.
+
+        Resolved addresses are cached for DNS_CACHE_TTL_SECONDS. If aiodns is installed, resolution is done on the
+        event loop by aiohttp.AsyncResolver rather than by aiohttp's default thread pool resolver.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.CONNECTION_LIMIT,
+            keepalive_timeout=min(
+                self._rest.poll_period_seconds + self.KEEPALIVE_MARGIN_SECONDS,
+                self.MAX_KEEPALIVE_SECONDS,
             ),
+            use_dns_cache=True,
+            ttl_dns_cache=self.DNS_CACHE_TTL_SECONDS,
+            resolver=aiohttp.AsyncResolver() if _AIODNS_INSTALLED else None,
         )
 
     async def _make_request(self, session: ClientSession) -> Optional[ClientResponse]:
+        request_errors = self._rest.errors.request
         try:
             args = self._request_args
             if args is None:
                 args = self._make_request_args()
             response = await session.request(args.method, args.url, **args.kwargs)
-            if self._rest.errors.request.error_for_http_status:
+            if request_errors.error_for_http_status:
                 response.raise_for_status()
         except Exception as e:
             response = None
-            if self._rest.errors.request.report:
-                try:  # noqa: SIM105
-                    self._forward(
-                        Message(
-                            Payload=Problems(errors=[e]).problem_event(
-                                summary=(
-                                    f"Request error for <{self._name}>: {type(e)} <{e}>"
-                                ),
-                            )
-                        )
-                    )
-                except:  # noqa: E722, S110
-                    pass
-            if self._rest.errors.request.raise_exception:
+            if request_errors.report:
+                self._report_error(
+                    e, f"Request error for <{self._name}>: {type(e)} <{e}>"
+                )
+            if request_errors.raise_exception:
                 raise
         return response
 
     async def _convert(self, response: ClientResponse) -> Optional[Message]:
+        convert_errors = self._rest.errors.convert
         try:
             message = await self._converter(response)
         except Exception as convert_exception:
             message = None
-            if self._rest.errors.convert.report:
-                try:  # noqa: SIM105
-                    self._forward(
-                        Message(
-                            Payload=Problems(errors=[convert_exception]).problem_event(
-                                summary=(
-                                    f"Convert error for <{self._name}>: {type(convert_exception)} <{convert_exception}>"
-                                ),
-                            )
-                        )
-                    )
-                except:  # noqa: E722, S110
-                    pass
-            if self._rest.errors.convert.raise_exception:
+            if convert_errors.report:
+                self._report_error(
+                    convert_exception,
+                    f"Convert error for <{self._name}>: {type(convert_exception)} <{convert_exception}>",
+                )
+            if convert_errors.raise_exception:
                 raise
         return message
 
+    async def _convert_body(self, response: ClientResponse) -> Optional[Message]:
+        return await self._bytes_converter(await response.read())
+
+    def _report_error(self, error: Exception, summary: str) -> None:
+        """Forward a problem event for error. Only called if reporting is enabled, so nothing is allocated for
+        errors which are not reported."""
+        try:  # noqa: SIM105
+            self._forward(
+                Message(Payload=Problems(errors=[error]).problem_event(summary=summary))
+            )
+        except:  # noqa: E722, S110
+            pass
+
     def _get_next_sleep_seconds(self) -> float:
         return self._rest.poll_period_seconds
 
+    def _forward_message(self, message: Message) -> None:
+        if self._forward_batch is None:
+            self._forward(message)
+        else:
+            if not self._pending:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self._batch_max_delay_seconds, self._flush_pending
+                )
+            self._pending.append(message)
+            if len(self._pending) >= self._batch_size:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending and self._forward_batch is not None:
+            pending = self._pending
+            self._pending = []
+            self._forward_batch(pending)
+
     async def _run(self) -> None:
         reconnect = True
         while reconnect:
             args = self._session_args
             if args is None:
                 args = self._make_session_args()
-            async with aiohttp.ClientSession(args.base_url, **args.kwargs) as session:
-                while True:
-                    response = await self._make_request(session)
-                    if response is not None:
-                        async with response:
-                            message = await self._convert(response)
-                        if message is not None:
-                            self._forward(message)
-                    sleep_seconds = self._get_next_sleep_seconds()
-                    await asyncio.sleep(sleep_seconds)
+            async with aiohttp.ClientSession(
+                args.base_url, connector=self._make_connector(), **args.kwargs
+            ) as session:
+                try:
+                    while True:
+                        response = await self._make_request(session)
+                        if response is not None:
+                            async with response:
+                                message = await self._convert(response)
+                            if message is not None:
+                                self._forward_message(message)
+                        sleep_seconds = self._get_next_sleep_seconds()
+                        await asyncio.sleep(sleep_seconds)
+                finally:
+                    self._flush_pending()
 
     def start(self) -> None:
         self._task_id = self._io_loop_manager.add_io_coroutine(
@@ -194,7 +325,7 @@ class RESTPoller:
 class RESTPollerActor(Actor):
     _poller: RESTPoller
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         name: str,
         services: ServicesInterface,
@@ -202,6 +333,10 @@ class RESTPollerActor(Actor):
         convert: Converter = null_converter,
         forward: ThreadSafeForwarder = null_forwarder,
         cache_request_args: bool = True,
+        forward_batch: Optional[ThreadSafeBatchForwarder] = None,
+        batch_size: int = 1,
+        batch_max_delay_seconds: Optional[float] = None,
+        convert_bytes: Optional[BytesConverter] = None,
     ) -> None:
         super().__init__(name, services)
         component = services.hardware_layout.component(self.name)
@@ -222,6 +357,10 @@ class RESTPollerActor(Actor):
             convert=convert,
             forward=forward,
             cache_request_args=cache_request_args,
+            forward_batch=forward_batch,
+            batch_size=batch_size,
+            batch_max_delay_seconds=batch_max_delay_seconds,
+            convert_bytes=convert_bytes,
         )
 
     def process_message(self, message: Message) -> Result[bool, Exception]:
@@ -1,27 +1,30 @@
 import argparse
 import logging
+import os
 import sys
 import traceback
 from pathlib import Path
 from typing import Optional, Type, TypeVar
 
 import dotenv
+import orjson
 import rich
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
 from gwproactor import Proactor, ProactorSettings, setup_logging
 from gwproactor.config import MQTTClient
-from gwproactor.config.paths import TLSPaths
+from gwproactor.config.mqtt import mqtt_field_names
+from gwproactor.config.paths import TLS_PATH_FIELD_NAMES, TLSPaths
 
 LOGGING_FORMAT = "%(asctime)s %(message)s"
 
 
 def missing_tls_paths(paths: TLSPaths) -> list[tuple[str, Optional[Path]]]:
     missing = []
-    for path_name in paths.model_fields:
+    for path_name in TLS_PATH_FIELD_NAMES:
         path = getattr(paths, path_name)
-        if path is None or not Path(path).exists():
+        if path is None or not os.path.exists(path):  # noqa: PTH110
             missing.append((path_name, path))
     return missing
 
@@ -29,15 +32,17 @@ def missing_tls_paths(paths: TLSPaths) -> list[tuple[str, Optional[Path]]]:
 def check_tls_paths_present(
     model: BaseModel | BaseSettings, *, raise_error: bool = True
 ) -> str:
-    missing_str = ""
-    for k in model.model_fields:
+    missing_parts = []
+    for k in mqtt_field_names(type(model)):
         v = getattr(model, k)
         if isinstance(v, MQTTClient) and v.tls.use_tls:
             missing_paths = missing_tls_paths(v.tls.paths)
             if missing_paths:
-                missing_str += f"client {k}\n"
-                for path_name, path in missing_paths:
-                    missing_str += f"  {path_name:20s}  {path}\n"
+                missing_parts.append(f"client {k}\n")
+                missing_parts.extend(
+                    f"  {path_name:20s}  {path}\n" for path_name, path in missing_paths
+                )
+    missing_str = "".join(missing_parts)
     if missing_str:
         error_str = f"ERROR. TLS usage requested but the following files are missing:\n{missing_str}"
         if raise_error:
@@ -72,19 +77,30 @@ def print_settings(
     settings: Optional[ProactorSettingsT] = None,
     env_file: str | Path = ".env",
 ) -> None:
-    dotenv_file = dotenv.find_dotenv(env_file)
-    rich.print(
-        f"Env file: <{dotenv_file}>  exists:{env_file and Path(dotenv_file).exists()}"
-    )
+    dotenv_file = dotenv.find_dotenv(str(env_file))
     settings = get_settings(
         settings_type=settings_type, settings=settings, env_file=dotenv_file
     )
+    _print_settings_report(
+        settings,
+        f"Env file: <{dotenv_file}>  exists:{env_file and Path(dotenv_file).exists()}",
+    )
+
+
+def _print_settings_report(settings: ProactorSettings, dotenv_file_str: str) -> None:
+    rich.print(dotenv_file_str)
     rich.print(settings)
     missing_tls_paths_ = check_tls_paths_present(settings, raise_error=False)
     if missing_tls_paths_:
         rich.print(missing_tls_paths_)
 
 
+def _dotenv_file_debug_str(dotenv_file: Optional[str]) -> str:
+    if dotenv_file is None:
+        return "Env file: <settings passed in>"
+    return f"Env file: <{dotenv_file}>  exists:{Path(dotenv_file).exists()}"
+
+
 def get_proactor(  # noqa: PLR0913
     name: str,
     proactor_type: Type[ProactorT],
@@ -97,20 +113,22 @@ def get_proactor(  # noqa: PLR0913
     env_file: str | Path = ".env",
     run_in_thread: bool = False,
     add_screen_handler: bool = True,
+    dotenv_file: Optional[str] = None,
 ) -> ProactorT:
-    dotenv_file = dotenv.find_dotenv(env_file)
-    dotenv_file_debug_str = (
-        f"Env file: <{dotenv_file}>  exists:{Path(dotenv_file).exists()}"
-    )
+    """Construct a proactor, loading settings if they are not passed in.
+
+    dotenv_file is the already-resolved env file the passed-in settings were loaded from, if any. It is only used
+    for reporting. If settings are not passed in, dotenv_file is resolved from env_file.
+    """
+    if dotenv_file is None and settings is None:
+        dotenv_file = dotenv.find_dotenv(str(env_file))
     settings = get_settings(
-        settings_type=settings_type, settings=settings, env_file=dotenv_file
+        settings_type=settings_type,
+        settings=settings,
+        env_file=env_file if dotenv_file is None else dotenv_file,
     )
     if dry_run:
-        rich.print(dotenv_file_debug_str)
-        rich.print(settings)
-        missing_tls_paths_ = check_tls_paths_present(settings, raise_error=False)
-        if missing_tls_paths_:
-            rich.print(missing_tls_paths_)
+        _print_settings_report(settings, _dotenv_file_debug_str(dotenv_file))
         rich.print("Dry run. Doing nothing.")
         sys.exit(0)
     else:
@@ -123,10 +141,15 @@ def get_proactor(  # noqa: PLR0913
         logger = logging.getLogger(
             settings.logging.qualified_logger_names()["lifecycle"]
         )
-        logger.info("")
-        logger.info(dotenv_file_debug_str)
-        logger.info("Settings:")
-        logger.info(settings.model_dump_json(indent=2))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("")
+            logger.info(_dotenv_file_debug_str(dotenv_file))
+            logger.info("Settings:")
+            logger.info(
+                orjson.dumps(
+                    settings.model_dump(mode="json"), option=orjson.OPT_INDENT_2
+                ).decode()
+            )
         rich.print(settings)
         check_tls_paths_present(settings)
         proactor = proactor_type(name=name, settings=settings)
@@ -147,10 +170,11 @@ async def run_async_main(  # noqa: PLR0913
     verbose: bool = False,
     message_summary: bool = False,
 ) -> None:
+    dotenv_file = dotenv.find_dotenv(str(env_file))
     settings = get_settings(
         settings_type=settings_type,
         settings=settings,
-        env_file=dotenv.find_dotenv(env_file),
+        env_file=dotenv_file,
     )
     exception_logger = logging.getLogger(settings.logging.base_log_name)
     try:
@@ -161,6 +185,7 @@ async def run_async_main(  # noqa: PLR0913
             dry_run=dry_run,
             verbose=verbose,
             message_summary=message_summary,
+            dotenv_file=dotenv_file,
         )
         exception_logger = proactor.logger
         try:
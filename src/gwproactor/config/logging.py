@@ -1,3 +1,4 @@
+import functools
 import logging
 import time
 from logging.handlers import RotatingFileHandler
@@ -58,10 +59,19 @@ class LoggerLevels(BaseModel):
     comm_event: int | str = logging.INFO
 
     def qualified_logger_names(self, base_log_name: str) -> dict[str, str]:
-        return {
-            field_name: f"{base_log_name}.{field_name}"
-            for field_name in self.model_fields
-        }
+        return dict(self._qualified_logger_name_items(base_log_name))
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _qualified_logger_name_items(
+        cls, base_log_name: str
+    ) -> tuple[tuple[str, str], ...]:
+        # Depends only on the class fields and base_log_name, so it is cached
+        # per class; callers get a fresh dict built from the cached items.
+        return tuple(
+            (field_name, f"{base_log_name}.{field_name}")
+            for field_name in cls.model_fields
+        )
 
     def _logger_levels(
         self, base_log_name: str, fields: Iterable[str]
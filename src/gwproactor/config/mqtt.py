@@ -1,7 +1,9 @@
+import functools
 import ssl
+import typing
 from pathlib import Path
 from ssl import VerifyMode
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, SecretStr
 
@@ -22,7 +24,13 @@ class TLSInfo(BaseModel):
         """Calculate non-set paths given a certs_dir and client name. Meant to be called in context where those are
         known, e.g. a validator on a higher-level model which has access to a Paths object and a named MQTT
         configuration."""
-        self.paths = self.paths.effective_paths(certs_dir, client_name)
+        paths = self.paths
+        if (
+            paths.ca_cert_path is None
+            or paths.cert_path is None
+            or paths.private_key_path is None
+        ):
+            self.paths = paths.effective_paths(certs_dir, client_name)
         return self
 
 
@@ -49,3 +57,31 @@ class MQTTClient(BaseModel):
         if self.tls.use_tls:
             return self.tls.port
         return self.port
+
+
+def _may_hold_mqtt_client(annotation: Any) -> bool:
+    """Whether a field with this annotation could hold an MQTTClient. This errs towards True: a field annotated Any,
+    a base class of MQTTClient such as BaseModel, or a type variable or forward reference, may hold one. Callers must
+    still check the field's value with isinstance()."""
+    if annotation is Any or isinstance(
+        annotation, (typing.TypeVar, typing.ForwardRef, str)
+    ):
+        return True
+    if typing.get_origin(annotation) is typing.Literal:
+        return False
+    if args := typing.get_args(annotation):
+        return any(_may_hold_mqtt_client(arg) for arg in args)
+    return isinstance(annotation, type) and (
+        issubclass(annotation, MQTTClient) or issubclass(MQTTClient, annotation)
+    )
+
+
+@functools.lru_cache
+def mqtt_field_names(model_type: type[BaseModel]) -> tuple[str, ...]:
+    """Names of the fields of model_type whose annotation allows an MQTTClient, calculated once per class. The
+    values of these fields must still be checked with isinstance()."""
+    return tuple(
+        field_name
+        for field_name, field_info in model_type.model_fields.items()
+        if _may_hold_mqtt_client(field_info.annotation)
+    )
@@ -1,9 +1,10 @@
+import functools
+import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Self
 
 import xdg
-from pydantic import BaseModel, Field, field_validator
-from pydantic_core.core_schema import ValidationInfo
+from pydantic import BaseModel, model_validator
 
 DEFAULT_BASE_NAME = "gridworks"
 DEFAULT_BASE_DIR = Path(DEFAULT_BASE_NAME)
@@ -12,6 +13,27 @@ DEFAULT_NAME_DIR = Path(DEFAULT_NAME)
 DEFAULT_LAYOUT_FILE = Path("hardware-layout.json")
 
 
+# The xdg home lookups are memoized, keyed on the environment variables they
+# read, so that repeated construction of default Paths objects does not rebuild
+# the same Path objects, while changes to the environment (e.g. by tests) are
+# still honored.
+
+
+@functools.lru_cache(maxsize=8)
+def _xdg_data_home(xdg_data_home: Optional[str], home: Optional[str]) -> Path:  # noqa: ARG001
+    return xdg.xdg_data_home()
+
+
+@functools.lru_cache(maxsize=8)
+def _xdg_state_home(xdg_state_home: Optional[str], home: Optional[str]) -> Path:  # noqa: ARG001
+    return xdg.xdg_state_home()
+
+
+@functools.lru_cache(maxsize=8)
+def _xdg_config_home(xdg_config_home: Optional[str], home: Optional[str]) -> Path:  # noqa: ARG001
+    return xdg.xdg_config_home()
+
+
 class TLSPaths(BaseModel):
     ca_cert_path: Optional[str | Path] = None
     cert_path: Optional[str | Path] = None
@@ -33,130 +55,116 @@ class TLSPaths(BaseModel):
         """Re-calculate non-set paths given a certs_dir and client name. Meant to be called in context where those are
         known, e.g. a validator on a higher-level model which has access to a Paths object and a named MQTT
         configuration."""
-        fields = self.defaults(Path(certs_dir), client_name).model_dump()
-        fields.update(self.model_dump(exclude_none=True))
-        return TLSPaths(**fields)
+        client_dir = Path(certs_dir) / client_name
+        return TLSPaths.model_construct(
+            ca_cert_path=(
+                client_dir / "ca.crt"
+                if self.ca_cert_path is None
+                else self.ca_cert_path
+            ),
+            cert_path=(
+                client_dir / f"{client_name}.crt"
+                if self.cert_path is None
+                else self.cert_path
+            ),
+            private_key_path=(
+                client_dir / "private" / f"{client_name}.pem"
+                if self.private_key_path is None
+                else self.private_key_path
+            ),
+        )
 
     def mkdirs(
         self, *, mode: int = 0o777, parents: bool = True, exist_ok: bool = True
     ) -> None:
         """Create directories that will be used to store certificates and private keys."""
-        if (
-            self.ca_cert_path is None
-            or self.cert_path is None
-            or self.private_key_path is None
-        ):
+        paths = [getattr(self, field_name) for field_name in TLS_PATH_FIELD_NAMES]
+        if any(path is None for path in paths):
             raise ValueError(
                 "ERROR. TLSPaths.mkdirs() requires all paths to nave non-None values. "
                 f"Current values: {self.model_dump()}"
             )
-        self.ca_cert_path.parent.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
-        self.cert_path.parent.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
-        self.private_key_path.parent.mkdir(
-            mode=mode, parents=parents, exist_ok=exist_ok
-        )
+        for parent in dict.fromkeys(Path(path).parent for path in paths):
+            parent.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
+
+
+TLS_PATH_FIELD_NAMES: tuple[str, ...] = tuple(TLSPaths.model_fields)
 
 
 class Paths(BaseModel):
     # Relative offsets used under home directories
-    base: str | Path = Field(default=DEFAULT_BASE_DIR, validate_default=True)
-    name: str | Path = Field(default=DEFAULT_NAME_DIR, validate_default=True)
-    relative_path: str | Path = Field(default="", validate_default=True)
+    base: str | Path = DEFAULT_BASE_DIR
+    name: str | Path = DEFAULT_NAME_DIR
+    relative_path: str | Path = ""
 
     # Home directories (defaulting to https://specifications.freedesktop.org/basedir-spec/latest/)
-    data_home: str | Path = Field(default="", validate_default=True)
-    state_home: str | Path = Field(default="", validate_default=True)
-    config_home: str | Path = Field(default="", validate_default=True)
+    data_home: str | Path = ""
+    state_home: str | Path = ""
+    config_home: str | Path = ""
 
     # Base working paths, defaulting to xdg home/relative_path/...
-    data_dir: str | Path = Field(default="", validate_default=True)
-    config_dir: str | Path = Field(default="", validate_default=True)
-    certs_dir: str | Path = Field(default="", validate_default=True)
-    event_dir: str | Path = Field(default="", validate_default=True)
-    log_dir: str | Path = Field(default="", validate_default=True)
-    hardware_layout: str | Path = Field(default="", validate_default=True)
-
-    @field_validator("base")
-    @classmethod
-    def get_base(cls, v: str | Path) -> Path:
-        return Path(v)
+    data_dir: str | Path = ""
+    config_dir: str | Path = ""
+    certs_dir: str | Path = ""
+    event_dir: str | Path = ""
+    log_dir: str | Path = ""
+    hardware_layout: str | Path = ""
 
-    @field_validator("name")
     @classmethod
-    def get_name(cls, v: str | Path) -> Path:
-        return Path(v)
+    def defaults(cls) -> "Paths":
+        """Construct a Paths object with every field at its default value, skipping pydantic validation of the
+        (known good) default inputs. Equivalent to Paths()."""
+        return cls.model_construct()._finalize_paths()  # noqa: SLF001
 
-    @field_validator("data_home")
-    @classmethod
-    def get_data_home(cls, v: str | Path) -> Path:
-        return Path(v or xdg.xdg_data_home())
-
-    @field_validator("state_home")
-    @classmethod
-    def get_state_home(cls, v: str | Path) -> Path:
-        return Path(v or xdg.xdg_state_home())
-
-    @field_validator("config_home")
-    @classmethod
-    def get_config_home(cls, v: str | Path) -> Path:
-        return Path(v or xdg.xdg_config_home())
+    @model_validator(mode="after")
+    def _finalize_paths(self) -> Self:
+        """Convert all fields to Path and calculate any unset paths from the ones they derive from.
 
-    @field_validator("config_dir")
-    @classmethod
-    def get_config_dir(cls, v: str | Path, info: ValidationInfo) -> Path:
-        if not v:
-            v = Path(info.data["config_home"]) / info.data["relative_path"]
-        return Path(v)
-
-    @field_validator("certs_dir")
-    @classmethod
-    def get_certs_dir(cls, v: str | Path, info: ValidationInfo) -> Path:
-        if not v:
-            v = Path(info.data["config_dir"]) / "certs"
-        return Path(v)
-
-    @field_validator("data_dir")
-    @classmethod
-    def get_data_dir(cls, v: str | Path, info: ValidationInfo) -> Path:
-        if not v:
-            v = Path(info.data["data_home"]) / info.data["relative_path"]
-        return Path(v)
-
-    @field_validator("event_dir")
-    @classmethod
-    def get_event_dir(cls, v: str | Path, info: ValidationInfo) -> Path:
-        if not v:
-            v = Path(info.data["data_dir"]) / "event"
-        return Path(v)
-
-    @field_validator("log_dir")
-    @classmethod
-    def get_log_dir(cls, v: str | Path, info: ValidationInfo) -> Path:
-        if not v:
-            v = Path(info.data["state_home"]) / info.data["relative_path"] / "log"
-        return Path(v)
-
-    @field_validator("hardware_layout")
-    @classmethod
-    def get_hardware_layout(cls, v: Any, info: ValidationInfo) -> Path:
-        if not v:
-            v = Path(info.data["config_dir"]) / DEFAULT_LAYOUT_FILE
-        return Path(v)
-
-    @field_validator("relative_path")
-    @classmethod
-    def get_relative_path(cls, v: str | Path, info: ValidationInfo) -> Path:
-        if not v:
-            v = Path(info.data["base"]) / info.data["name"]
-        return Path(v)
+        Values are written directly into __dict__ rather than by attribute assignment so that model_fields_set still
+        reports only the fields explicitly passed by the caller, which copy() relies on.
+        """
+        base = Path(self.base)
+        name = Path(self.name)
+        relative_path = Path(self.relative_path or base / name)
+        environ = os.environ
+        home = environ.get("HOME")
+        data_home = Path(
+            self.data_home or _xdg_data_home(environ.get("XDG_DATA_HOME"), home)
+        )
+        state_home = Path(
+            self.state_home or _xdg_state_home(environ.get("XDG_STATE_HOME"), home)
+        )
+        config_home = Path(
+            self.config_home or _xdg_config_home(environ.get("XDG_CONFIG_HOME"), home)
+        )
+        data_dir = Path(self.data_dir or data_home / relative_path)
+        config_dir = Path(self.config_dir or config_home / relative_path)
+        self.__dict__.update(
+            base=base,
+            name=name,
+            relative_path=relative_path,
+            data_home=data_home,
+            state_home=state_home,
+            config_home=config_home,
+            data_dir=data_dir,
+            config_dir=config_dir,
+            certs_dir=Path(self.certs_dir or config_dir / "certs"),
+            event_dir=Path(self.event_dir or data_dir / "event"),
+            log_dir=Path(self.log_dir or state_home / relative_path / "log"),
+            hardware_layout=Path(
+                self.hardware_layout or config_dir / DEFAULT_LAYOUT_FILE
+            ),
+        )
+        return self
 
     def mkdirs(
         self, *, mode: int = 0o777, parents: bool = True, exist_ok: bool = True
     ) -> None:
-        self.data_dir.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
-        self.config_dir.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
-        self.event_dir.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
-        self.log_dir.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
+        for d in dict.fromkeys(
+            Path(d)
+            for d in (self.data_dir, self.config_dir, self.event_dir, self.log_dir)
+        ):
+            d.mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
 
     def copy(self, **kwargs: Any) -> "Paths":
         fields = self.model_dump(exclude_unset=True)
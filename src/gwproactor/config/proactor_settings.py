@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from gwproactor.config.logging import LoggingSettings
-from gwproactor.config.mqtt import MQTTClient
+from gwproactor.config.mqtt import MQTTClient, mqtt_field_names
 from gwproactor.config.paths import Paths
 
 MQTT_LINK_POLL_SECONDS = 60.0
@@ -13,18 +13,20 @@ NUM_INITIAL_EVENT_REUPLOADS: int = 5
 
 
 class ProactorSettings(BaseSettings):
-    paths: Paths = Field({}, validate_default=True)
+    paths: Paths = Field(default_factory=Paths.defaults)
     logging: LoggingSettings = LoggingSettings()
     mqtt_link_poll_seconds: float = MQTT_LINK_POLL_SECONDS
     ack_timeout_seconds: float = ACK_TIMEOUT_SECONDS
     num_initial_event_reuploads: int = NUM_INITIAL_EVENT_REUPLOADS
+    # Run the IOLoop thread on uvloop, if uvloop is installed.
+    use_uvloop: bool = True
     model_config = SettingsConfigDict(env_prefix="PROACTOR_", env_nested_delimiter="__")
 
     @field_validator("paths")
     @classmethod
     def get_paths(cls, v: Paths) -> Paths:
         if not v:
-            v = Paths()
+            v = Paths.defaults()
         return v
 
     @classmethod
@@ -49,7 +51,7 @@ class ProactorSettings(BaseSettings):
             raise ValueError(  # noqa: TRY004
                 f"ERROR. 'paths' member must be instance of Paths. Got: {type(self.paths)}"
             )
-        for field_name in self.model_fields:
+        for field_name in mqtt_field_names(type(self)):
             v = getattr(self, field_name)
             if isinstance(v, MQTTClient):
                 v.update_tls_paths(self.paths.certs_dir, field_name)
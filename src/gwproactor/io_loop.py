@@ -1,7 +1,9 @@
 import asyncio
+import collections
 import contextlib
+import functools
+import itertools
 import threading
-import time
 from typing import Coroutine, Optional, Sequence
 
 from gwproto import Message
@@ -18,45 +20,55 @@ from gwproactor.proactor_interface import (
 )
 from gwproactor.problems import Problems
 from gwproactor.sync_thread import SyncAsyncInteractionThread
+from gwproactor.uvloop_support import new_event_loop
+
+# Number of recently completed tasks kept for debugging.
+COMPLETED_TASK_HISTORY = 256
 
 
 class IOLoop(Communicator, IOLoopInterface):
+    """Runs coroutines on an asyncio event loop in a separate thread.
+
+    The task bookkeeping (_tasks, _completed_tasks, _errors) is only touched on the IO thread. Other threads reach
+    it by scheduling callbacks with call_soon_threadsafe(), so no lock is needed. Task ids come from an
+    itertools.count(), whose next() is atomic under the GIL.
+
+    The loop is event driven: task completion is handled by done callbacks, the internal watchdog is patted from a
+    self-rescheduling call_later() timer, and _async_run simply waits for _done to be set by stop() or by a task
+    failing.
+    """
+
     _io_loop: asyncio.AbstractEventLoop
     _io_thread: Optional[threading.Thread] = None
-    _tasks: dict[int, Optional[asyncio.Task]]
-    _id2task: dict[asyncio.Task, int]
-    _completed_tasks: dict[int, asyncio.Task]
-    _lock: threading.RLock
+    _tasks: dict[int, asyncio.Task]
+    _completed_tasks: collections.deque[tuple[int, asyncio.Task]]
+    _errors: list[BaseException]
+    _done: asyncio.Event
+    _pat_handle: Optional[asyncio.TimerHandle] = None
     _stop_requested: bool = False
-    _next_id = INVALID_IO_TASK_HANDLE + 1
+    _task_ids: itertools.count
     _pat_timeout: float = SyncAsyncInteractionThread.PAT_TIMEOUT
-    _last_pat_time: float = 0.0
     _lg: ProactorLogger
 
     def __init__(self, services: ServicesInterface) -> None:
         super().__init__(KnownNames.io_loop_manager.value, services)
         self._lg = services.logger
-        self._lock = threading.RLock()
+        self._task_ids = itertools.count(INVALID_IO_TASK_HANDLE + 1)
         self._tasks = {}
-        self._id2task = {}
-        self._completed_tasks = {}
-        self._io_loop = asyncio.new_event_loop()
+        self._completed_tasks = collections.deque(maxlen=COMPLETED_TASK_HISTORY)
+        self._errors = []
+        self._done = asyncio.Event()
+        self._io_loop = new_event_loop(use_uvloop=services.settings.use_uvloop)
 
     def add_io_coroutine(self, coro: Coroutine, name: str = "") -> int:
-        with self._lock:
-            if self._stop_requested:
-                return INVALID_IO_TASK_HANDLE
-            task_id = self._next_id
-            self._next_id += 1
-            self._tasks[task_id] = None
+        if self._stop_requested:
+            return INVALID_IO_TASK_HANDLE
+        task_id = next(self._task_ids)
         self._io_loop.call_soon_threadsafe(self._add_task, coro, name, task_id)
         return task_id
 
     def cancel_io_routine(self, handle: int) -> None:
-        with self._lock:
-            task = self._tasks.pop(handle, None)
-        if task is not None:
-            self._io_loop.call_soon_threadsafe(task.cancel)
+        self._io_loop.call_soon_threadsafe(self._cancel_task, handle)
 
     def _add_task(self, coro: Coroutine, name: str, task_id: int) -> None:
         if not name:
@@ -65,9 +77,31 @@ class IOLoop(Communicator, IOLoopInterface):
             coro,
             name=name,
         )
-        with self._lock:
-            self._tasks[task_id] = task
-            self._id2task[task] = task_id
+        task.add_done_callback(functools.partial(self._task_done, task_id))
+        self._tasks[task_id] = task
+
+    def _task_done(self, task_id: int, task: asyncio.Task) -> None:
+        if self._tasks.pop(task_id, None) is not None:
+            self._completed_tasks.append((task_id, task))
+        if self._stop_requested or task.cancelled():
+            return
+        try:
+            exception = task.exception()
+        except Exception as retrieve_exception:  # noqa: BLE001
+            exception = retrieve_exception
+        if exception is not None:
+            self._errors.append(exception)
+            self._done.set()
+
+    def _cancel_task(self, task_id: int) -> None:
+        task = self._tasks.pop(task_id, None)
+        if task is not None:
+            task.cancel()
+
+    def _stop_tasks(self) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+        self._done.set()
 
     def start(self) -> None:
         self._io_thread = threading.Thread(
@@ -75,16 +109,9 @@ class IOLoop(Communicator, IOLoopInterface):
         )
         self._io_thread.start()
 
-    def _started_tasks(self) -> list[asyncio.Task]:
-        with self._lock:
-            return [task for task in self._tasks.values() if task is not None]
-
     def stop(self) -> None:
-        with self._lock:
-            self._stop_requested = True
-            tasks = self._started_tasks()
-        for task in tasks:
-            self._io_loop.call_soon_threadsafe(task.cancel)
+        self._stop_requested = True
+        self._io_loop.call_soon_threadsafe(self._stop_tasks)
 
     async def join(self) -> None:
         pass
@@ -117,53 +144,29 @@ class IOLoop(Communicator, IOLoopInterface):
         finally:
             self._io_loop.stop()
 
-    async def _async_run(self) -> None:  # noqa: C901, PLR0912
-        try:  # noqa: PLR1702
-            while not self._stop_requested:
-                with self._lock:
-                    tasks = self._started_tasks()
-                if not self._stop_requested and not tasks:
-                    try:
-                        await asyncio.sleep(1)
-                    except asyncio.CancelledError:
-                        pass
-                    except GeneratorExit:
-                        pass
-                else:
-                    done, _ = await asyncio.wait(
-                        tasks, timeout=1.0, return_when="FIRST_COMPLETED"
-                    )
-                    if self._stop_requested:
-                        break
-                    with self._lock:
-                        for task in done:
-                            task_id = self._id2task.pop(task)
-                            self._completed_tasks[task_id] = self._tasks.pop(task_id)
-                    errors = []
-                    for task in done:
-                        if not task.cancelled():
-                            try:
-                                exception = task.exception()
-                                if exception is not None:
-                                    errors.append(exception)
-                            except Exception as retrieve_exception:  # noqa: BLE001
-                                errors.append(retrieve_exception)
-                    if errors:
-                        raise Problems(
-                            f"IOLoop caught {len(errors)}.",
-                            errors=errors,
-                        )
-                if self.time_to_pat():
-                    self.pat_watchdog()
+    async def _async_run(self) -> None:
+        try:
+            self._pat_and_reschedule()
+            await self._done.wait()
+            if self._errors and not self._stop_requested:
+                raise Problems(
+                    f"IOLoop caught {len(self._errors)}.",
+                    errors=self._errors,
+                )
         finally:
+            if self._pat_handle is not None:
+                self._pat_handle.cancel()
             self._io_loop.stop()
 
-    def time_to_pat(self) -> bool:
-        return time.time() >= (self._last_pat_time + (self._pat_timeout / 2))
+    def _pat_and_reschedule(self) -> None:
+        self.pat_watchdog()
+        if not self._stop_requested:
+            self._pat_handle = self._io_loop.call_later(
+                self._pat_timeout / 2, self._pat_and_reschedule
+            )
 
     def pat_watchdog(self) -> None:
         if not self._stop_requested:
-            self._last_pat_time = time.time()
             self._services.send_threadsafe(PatInternalWatchdogMessage(src=self.name))
 
     def process_message(self, message: Message) -> Result[bool, Exception]:  # noqa: ARG002
@@ -1,26 +1,60 @@
-from gwproactor.links.acks import (
-    DEFAULT_ACK_DELAY,
-    AckManager,
-    AckTimerCallback,
-    AckWaitInfo,
-)
-from gwproactor.links.asyncio_timer_manager import AsyncioTimerManager
-from gwproactor.links.link_manager import LinkManager, LinkManagerTransition
-from gwproactor.links.link_state import (
-    CommLinkAlreadyExists,
-    CommLinkMissing,
-    InvalidCommStateInput,
-    LinkState,
-    LinkStates,
-    RuntimeLinkStateError,
-    StateName,
-    Transition,
-    TransitionName,
-)
-from gwproactor.links.message_times import LinkMessageTimes, MessageTimes
-from gwproactor.links.mqtt import QOS, MQTTClients, MQTTClientWrapper, Subscription
-from gwproactor.links.reuploads import Reuploads
-from gwproactor.links.timer_interface import TimerManagerInterface
+# ruff: noqa: TCH004
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gwproactor.links.acks import (
+        DEFAULT_ACK_DELAY,
+        AckManager,
+        AckTimerCallback,
+        AckWaitInfo,
+    )
+    from gwproactor.links.asyncio_timer_manager import AsyncioTimerManager
+    from gwproactor.links.link_manager import LinkManager, LinkManagerTransition
+    from gwproactor.links.link_state import (
+        CommLinkAlreadyExists,
+        CommLinkMissing,
+        InvalidCommStateInput,
+        LinkState,
+        LinkStates,
+        RuntimeLinkStateError,
+        StateName,
+        Transition,
+        TransitionName,
+    )
+    from gwproactor.links.message_times import LinkMessageTimes, MessageTimes
+    from gwproactor.links.mqtt import QOS, MQTTClients, MQTTClientWrapper, Subscription
+    from gwproactor.links.reuploads import Reuploads
+    from gwproactor.links.timer_interface import TimerManagerInterface
+    from gwproactor.links.timing_wheel_timer_manager import TimingWheelTimerManager
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "DEFAULT_ACK_DELAY": "gwproactor.links.acks",
+    "AckManager": "gwproactor.links.acks",
+    "AckTimerCallback": "gwproactor.links.acks",
+    "AckWaitInfo": "gwproactor.links.acks",
+    "AsyncioTimerManager": "gwproactor.links.asyncio_timer_manager",
+    "LinkManager": "gwproactor.links.link_manager",
+    "LinkManagerTransition": "gwproactor.links.link_manager",
+    "CommLinkAlreadyExists": "gwproactor.links.link_state",
+    "CommLinkMissing": "gwproactor.links.link_state",
+    "InvalidCommStateInput": "gwproactor.links.link_state",
+    "LinkState": "gwproactor.links.link_state",
+    "LinkStates": "gwproactor.links.link_state",
+    "RuntimeLinkStateError": "gwproactor.links.link_state",
+    "StateName": "gwproactor.links.link_state",
+    "Transition": "gwproactor.links.link_state",
+    "TransitionName": "gwproactor.links.link_state",
+    "LinkMessageTimes": "gwproactor.links.message_times",
+    "MessageTimes": "gwproactor.links.message_times",
+    "QOS": "gwproactor.links.mqtt",
+    "MQTTClients": "gwproactor.links.mqtt",
+    "MQTTClientWrapper": "gwproactor.links.mqtt",
+    "Subscription": "gwproactor.links.mqtt",
+    "Reuploads": "gwproactor.links.reuploads",
+    "TimerManagerInterface": "gwproactor.links.timer_interface",
+    "TimingWheelTimerManager": "gwproactor.links.timing_wheel_timer_manager",
+}
 
 __all__ = [
     "DEFAULT_ACK_DELAY",
@@ -45,6 +79,22 @@ __all__ = [
     "StateName",
     "Subscription",
     "TimerManagerInterface",
+    "TimingWheelTimerManager",
     "Transition",
     "TransitionName",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public names of this package on first access (PEP 562), so that importing one submodule, such as
+    gwproactor.links.mqtt, does not also import LinkManager and everything it depends on."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
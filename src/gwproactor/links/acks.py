@@ -1,11 +1,12 @@
 import functools
+import sys
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
 from gwproactor.links.timer_interface import TimerManagerInterface
 
 
-@dataclass
+@dataclass(slots=True)
 class AckWaitInfo:
     link_name: str
     message_id: str
@@ -28,7 +29,7 @@ class AckManager:
         self,
         timer_mgr: TimerManagerInterface,
         callback: AckTimerCallback,
-        delay: Optional[float] = DEFAULT_ACK_DELAY,
+        delay: float = DEFAULT_ACK_DELAY,
     ) -> None:
         self._acks = {}
         self._timer_mgr = timer_mgr
@@ -42,34 +43,37 @@ class AckManager:
         context: Optional[Any] = None,
         delay_seconds: Optional[float] = None,
     ) -> AckWaitInfo:
-        self.cancel_ack_timer(link_name, message_id)
-        delay_seconds = (
-            self._default_delay_seconds if delay_seconds is None else delay_seconds
-        )
+        if (link_acks := self._acks.get(link_name)) is None:
+            self._acks[link_name] = link_acks = {}
+        elif (prev_wait_info := link_acks.pop(message_id, None)) is not None:
+            self._timer_mgr.cancel_timer(prev_wait_info.timer_handle)
         wait_info = AckWaitInfo(
             link_name=link_name,
             message_id=message_id,
-            timer_handle=self._timer_mgr.start_timer(
-                self._default_delay_seconds if delay_seconds is None else delay_seconds,
-                functools.partial(self._timeout, link_name, message_id),
-            ),
+            timer_handle=None,
             context=context,
         )
-        if link_name not in self._acks:
-            self._acks[link_name] = {}
-        self._acks[link_name][message_id] = wait_info
+        wait_info.timer_handle = self._timer_mgr.start_timer(
+            self._default_delay_seconds if delay_seconds is None else delay_seconds,
+            functools.partial(self._timeout, wait_info),
+        )
+        link_acks[message_id] = wait_info
         return wait_info
 
     def add_link(self, link_name: str) -> None:
-        self._acks[link_name] = {}
+        self._acks[sys.intern(link_name)] = {}
 
     def _pop_wait_info(self, link_name: str, message_id: str) -> Optional[AckWaitInfo]:
         if (client_acks := self._acks.get(link_name, None)) is not None:
             return client_acks.pop(message_id, None)
         return None
 
-    def _timeout(self, link_name: str, message_id: str) -> None:
-        if (wait_info := self._pop_wait_info(link_name, message_id)) is not None:
+    def _timeout(self, wait_info: AckWaitInfo) -> None:
+        # Only report the timeout if this wait is still the current one for its message id; the timer may have been
+        # cancelled or restarted while this callback was in flight.
+        link_acks = self._acks.get(wait_info.link_name)
+        if link_acks is not None and link_acks.get(wait_info.message_id) is wait_info:
+            del link_acks[wait_info.message_id]
             self._user_callback(wait_info)
 
     def cancel_ack_timer(self, link_name: str, message_id: str) -> AckWaitInfo:
@@ -78,13 +82,12 @@ class AckManager:
         return wait_info
 
     def cancel_ack_timers(self, link_name: str) -> list[AckWaitInfo]:
-        if link_name in self._acks:
-            wait_infos = self._acks[link_name]
-            self._acks[link_name] = {}
-            for wait_info in wait_infos.values():
-                self._timer_mgr.cancel_timer(wait_info.timer_handle)
-        else:
-            wait_infos = []
+        if (link_acks := self._acks.get(link_name)) is None:
+            return []
+        wait_infos = list(link_acks.values())
+        link_acks.clear()
+        for wait_info in wait_infos:
+            self._timer_mgr.cancel_timer(wait_info.timer_handle)
         return wait_infos
 
     def num_acks(self, link_name: str) -> int:
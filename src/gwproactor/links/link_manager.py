@@ -1,9 +1,10 @@
 import asyncio
-import json
 import logging
-from dataclasses import asdict, dataclass, field
-from typing import Any, Optional, Tuple, Union
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional, Self, Tuple, Union
 
+import orjson
 from gwproto import Message, MQTTCodec, MQTTTopic
 from gwproto.messages import (
     Ack,
@@ -45,7 +46,6 @@ from gwproactor.message import (
     MQTTSubackPayload,
 )
 from gwproactor.persister import (
-    ByteDecodingError,
     DecodingError,
     FileEmptyWarning,
     JSONDecodingError,
@@ -55,11 +55,22 @@ from gwproactor.persister import (
 from gwproactor.problems import Problems
 from gwproactor.stats import ProactorStats
 
+_TRANSITION_FIELD_NAMES = tuple(f.name for f in fields(Transition))
+
 
 @dataclass
 class LinkManagerTransition(Transition):
     canceled_acks: list[AckWaitInfo] = field(default_factory=list)
 
+    @classmethod
+    def from_transition(
+        cls, transition: Transition, canceled_acks: Optional[list[AckWaitInfo]] = None
+    ) -> Self:
+        return cls(
+            canceled_acks=[] if canceled_acks is None else canceled_acks,
+            **{name: getattr(transition, name) for name in _TRANSITION_FIELD_NAMES},
+        )
+
 
 class LinkManager:
     PERSISTER_ENCODING = "utf-8"
@@ -73,6 +84,7 @@ class LinkManager:
     _mqtt_clients: MQTTClients
     _mqtt_codecs: dict[str, MQTTCodec]
     _states: LinkStates
+    _upstream_state: Optional[LinkState] = None
     _message_times: MessageTimes
     _acks: AckManager
 
@@ -177,6 +189,7 @@ class LinkManager:
         return self._states[name]
 
     def get_message_times(self, link_name: str) -> LinkMessageTimes:
+        """Copy of the link's send and receive times. These are time.monotonic() values; see LinkMessageTimes."""
         return self._message_times.get_copy(link_name)
 
     def stopped(self, name: str) -> bool:
@@ -185,7 +198,9 @@ class LinkManager:
     def add_mqtt_link(self, settings: LinkSettings) -> None:
         self._mqtt_clients.add_client(settings)
         self._mqtt_codecs[settings.client_name] = settings.codec
-        self._states.add(settings.client_name)
+        link_state = self._states.add(settings.client_name)
+        if settings.upstream:
+            self._upstream_state = link_state
         self._message_times.add_link(settings.client_name)
         self._stats.add_link(settings.client_name)
         self.subscribe(
@@ -276,15 +291,12 @@ class LinkManager:
         if isinstance(event, ProblemEvent) and self._logger.path_enabled:
             path_dbg |= 0x00000004
             self._logger.info(event)
-        if (
-            self._mqtt_clients.upstream_client
-            and self._states[self._mqtt_clients.upstream_client].active_for_send()
-        ):
+        if self._upstream_state is not None and self._upstream_state.active_for_send():
             path_dbg |= 0x00000008
             self.publish_upstream(event, AckRequired=True)
         result = self._event_persister.persist(
             event.MessageId,
-            event.model_dump_json(indent=2).encode(self.PERSISTER_ENCODING),
+            event.model_dump_json().encode(self.PERSISTER_ENCODING),
         )
         self._logger.path(
             "--generate_event %s  path:0x%08X  %d - %d",
@@ -321,7 +333,7 @@ class LinkManager:
                 for event_id in event_ids:
                     event_path_dbg = 0x00000004
                     tried_count_dbg += 1
-                    problems = Problems()
+                    problems = None
                     ret = self._reupload_event(event_id)
                     if ret.is_ok():
                         event_path_dbg |= 0x00000008
@@ -331,10 +343,10 @@ class LinkManager:
                             sent_one = True
                         else:
                             event_path_dbg |= 0x00000020
-                            problems.add_error(DecodingError(uid=event_id))
+                            problems = Problems().add_error(DecodingError(uid=event_id))
                     else:
                         event_path_dbg |= 0x00000040
-                        problems.add_problems(ret.err())
+                        problems = ret.err()
                     if problems:
                         event_path_dbg |= 0x00000080
                         # There was some error decoding this event.
@@ -377,51 +389,47 @@ class LinkManager:
         """
         self._logger.path("++_reupload_event  %s", event_id)
         path_dbg = 0
-        problems = Problems()
         match self._event_persister.retrieve(event_id):
             case Ok(event_bytes):
                 path_dbg |= 0x00000001
                 if event_bytes is None:
                     path_dbg |= 0x00000002
-                    problems.add_error(
+                    problems = Problems().add_error(
                         UIDMissingWarning("reupload_events", uid=event_id)
                     )
                 elif len(event_bytes) == 0:
                     path_dbg |= 0x00000004
-                    problems.add_error(
+                    problems = Problems().add_error(
                         FileEmptyWarning("reupload_events", uid=event_id)
                     )
                 else:
                     path_dbg |= 0x00000008
+                    # orjson rejects invalid UTF-8 as a JSON decode error.
                     try:
-                        event_str = event_bytes.decode(encoding=self.PERSISTER_ENCODING)
+                        event = orjson.loads(event_bytes)
                     except Exception as e:  # noqa: BLE001
-                        path_dbg |= 0x00000010
-                        problems.add_error(e).add_error(
-                            ByteDecodingError("reupload_events", uid=event_id)
+                        path_dbg |= 0x00000040
+                        event_str = event_bytes.decode(
+                            encoding=self.PERSISTER_ENCODING, errors="replace"
                         )
-                    else:
-                        path_dbg |= 0x00000020
-                        try:
-                            event = json.loads(event_str)
-                        except Exception as e:  # noqa: BLE001
-                            path_dbg |= 0x00000040
-                            problems.add_error(e).add_error(
+                        problems = (
+                            Problems()
+                            .add_error(e)
+                            .add_error(
                                 JSONDecodingError(
                                     f"reupload_events - raw json:\n<\n{event_str}\n>",
                                     uid=event_id,
                                 )
                             )
-                        else:
-                            path_dbg |= 0x00000080
-                            self.publish_upstream(event, AckRequired=True)
-                            self._logger.path(
-                                "--_reupload_event:1  path:0x%08X", path_dbg
-                            )
-                            return Ok(value=True)
+                        )
+                    else:
+                        path_dbg |= 0x00000080
+                        self.publish_upstream(event, AckRequired=True)
+                        self._logger.path("--_reupload_event:1  path:0x%08X", path_dbg)
+                        return Ok(value=True)
             case Err(error):
                 path_dbg |= 0x00000100
-                problems.add_problems(error)
+                problems = Problems().add_problems(error)
         self._logger.path("--_reupload_event:0  path:0x%08X", path_dbg)
         return Err(problems)
 
@@ -465,8 +473,7 @@ class LinkManager:
     ) -> Result[LinkManagerTransition, InvalidCommStateInput]:
         state_result = self._states.process_mqtt_disconnected(message)
         if state_result.is_ok():
-            # noinspection PyTypeChecker
-            result = Ok(LinkManagerTransition(**(asdict(state_result.value))))
+            result = Ok(LinkManagerTransition.from_transition(state_result.value))
             self.generate_event(
                 MQTTDisconnectEvent(PeerName=message.Payload.client_name)
             )
@@ -509,10 +516,9 @@ class LinkManager:
         self._stats.link(wait_info.link_name).timeouts += 1
         state_result = self._states.process_ack_timeout(wait_info.link_name)
         if state_result.is_ok():
-            # noinspection PyTypeChecker
             result = Ok(
-                LinkManagerTransition(
-                    canceled_acks=[wait_info], **(asdict(state_result.value))
+                LinkManagerTransition.from_transition(
+                    state_result.value, canceled_acks=[wait_info]
                 )
             )
             path_dbg |= 0x00000001
@@ -567,18 +573,17 @@ class LinkManager:
         ]
 
     async def send_ping(self, link_name: str) -> None:
+        message_times = self._message_times
         while not self._states.stopped(link_name):
-            message_times = self._message_times.get_copy(link_name)
-            link_state = self._states[link_name]
+            link_poll_seconds = self._settings.mqtt_link_poll_seconds
+            now = time.monotonic()
             if (
-                message_times.time_to_send_ping(self._settings.mqtt_link_poll_seconds)
-                and link_state.active_for_send()
+                message_times.time_to_send_ping(link_name, link_poll_seconds, now)
+                and self._states[link_name].active_for_send()
             ):
                 self.publish_message(link_name, PingMessage(Src=self.publication_name))
             await asyncio.sleep(
-                message_times.seconds_until_next_ping(
-                    self._settings.mqtt_link_poll_seconds
-                )
+                message_times.seconds_until_next_ping(link_name, link_poll_seconds, now)
             )
 
     def update_recv_time(self, link_name: str) -> None:
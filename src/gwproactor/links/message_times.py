@@ -1,40 +1,69 @@
-import dataclasses
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Optional
 
 from gwproactor.config.proactor_settings import MQTT_LINK_POLL_SECONDS
 
-import_time = time.time()
+import_time = time.monotonic()
 
+# Offset which converts the monotonic times stored here to wall-clock (epoch) seconds for display.
+monotonic_to_wall = time.time() - import_time
 
-@dataclass
+
+@dataclass(slots=True)
 class LinkMessageTimes:
-    last_send: float = field(default_factory=time.time)
-    last_recv: float = field(default_factory=time.time)
+    """Send and receive times for a link.
+
+    last_send and last_recv are time.monotonic() values, not wall-clock (epoch) times, so they must not be compared
+    with time.time(). Use last_send_wall and last_recv_wall for wall-clock times.
+    """
+
+    last_send: float = field(default_factory=time.monotonic)
+    last_recv: float = field(default_factory=time.monotonic)
+
+    @property
+    def last_send_wall(self) -> float:
+        return self.last_send + monotonic_to_wall
+
+    @property
+    def last_recv_wall(self) -> float:
+        return self.last_recv + monotonic_to_wall
 
     def next_ping_second(self, link_poll_seconds: float) -> float:
         return self.last_send + link_poll_seconds
 
-    def seconds_until_next_ping(self, link_poll_seconds: float) -> float:
-        return self.next_ping_second(link_poll_seconds) - time.time()
+    def seconds_until_next_ping(
+        self, link_poll_seconds: float, now: Optional[float] = None
+    ) -> float:
+        if now is None:
+            now = time.monotonic()
+        return self.next_ping_second(link_poll_seconds) - now
 
-    def time_to_send_ping(self, link_poll_seconds: float) -> bool:
-        return time.time() > self.next_ping_second(link_poll_seconds)
+    def time_to_send_ping(
+        self, link_poll_seconds: float, now: Optional[float] = None
+    ) -> bool:
+        if now is None:
+            now = time.monotonic()
+        return now > self.next_ping_second(link_poll_seconds)
 
     def get_str(
         self,
         *,
         link_poll_seconds: float = MQTT_LINK_POLL_SECONDS,
         relative: bool = True,
+        now: Optional[float] = None,
     ) -> str:
-        adjust = import_time if relative else 0
+        adjust = import_time if relative else -monotonic_to_wall
+        if now is None:
+            now = time.monotonic()
+        next_ping_second = self.next_ping_second(link_poll_seconds)
         return (
-            f"n:{time.time() - adjust:5.2f}  lps:{link_poll_seconds:5.2f}  "
+            f"n:{now - adjust:5.2f}  lps:{link_poll_seconds:5.2f}  "
             f"ls:{self.last_send - adjust:5.2f}  lr:{self.last_recv - adjust:5.2f}  "
-            f"nps:{self.next_ping_second(link_poll_seconds) - adjust:5.2f}  "
-            f"snp:{self.next_ping_second(link_poll_seconds):5.2f}  "
-            f"tsp:{int(self.time_to_send_ping(link_poll_seconds))}"
+            f"nps:{next_ping_second - adjust:5.2f}  "
+            f"snp:{next_ping_second + monotonic_to_wall:5.2f}  "
+            f"tsp:{int(now > next_ping_second)}"
         )
 
     def __str__(self) -> str:
@@ -42,26 +71,39 @@ class LinkMessageTimes:
 
 
 class MessageTimes:
+    __slots__ = ("_links",)
+
     _links: dict[str, LinkMessageTimes]
 
     def __init__(self) -> None:
         self._links = {}
 
     def add_link(self, name: str) -> None:
-        self._links[name] = LinkMessageTimes()
+        self._links[sys.intern(name)] = LinkMessageTimes()
 
     def get_copy(self, link_name: str) -> LinkMessageTimes:
-        return dataclasses.replace(self._links[link_name])
+        link_times = self._links[link_name]
+        return LinkMessageTimes(link_times.last_send, link_times.last_recv)
 
     def update_send(self, link_name: str, now: Optional[float] = None) -> None:
         if now is None:
-            now = time.time()
+            now = time.monotonic()
         self._links[link_name].last_send = now
 
     def update_recv(self, link_name: str, now: Optional[float] = None) -> None:
         if now is None:
-            now = time.time()
+            now = time.monotonic()
         self._links[link_name].last_recv = now
 
+    def time_to_send_ping(
+        self, link_name: str, link_poll_seconds: float, now: Optional[float] = None
+    ) -> bool:
+        return self._links[link_name].time_to_send_ping(link_poll_seconds, now)
+
+    def seconds_until_next_ping(
+        self, link_name: str, link_poll_seconds: float, now: Optional[float] = None
+    ) -> float:
+        return self._links[link_name].seconds_until_next_ping(link_poll_seconds, now)
+
     def link_names(self) -> list[str]:
         return list(self._links.keys())
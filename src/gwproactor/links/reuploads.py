@@ -117,9 +117,10 @@ class Reuploads:
         self._reuploaded_unacked.pop(ack_id)
 
     def process_ack_for_reupload(self, ack_id: str) -> list[str]:
-        """If ack_id is in our "unacked" store, remove it from the unacked store. If any events remain in our "pending"
-        store, move the first pending event from the pending store to the unacked store and return it for sending
-        next."""
+        """If ack_id is in our "unacked" store, remove it from the unacked store. Then, while the unacked store holds
+        fewer than _num_initial_events, move events from the front of the "pending" store to the unacked store and
+        return them for sending next. This keeps the window of in-flight events full even after events were dropped
+        from it, e.g. because they could not be decoded."""
 
         path_dbg = 0
         was_reuploading = self.reuploading()
@@ -130,12 +131,15 @@ class Reuploads:
         if ack_id in self._reuploaded_unacked:
             path_dbg |= 0x00000001
             self._reuploaded_unacked.pop(ack_id)
-            if self._reupload_pending:
+            while (
+                self._reupload_pending
+                and len(self._reuploaded_unacked) < self._num_initial_events
+            ):
                 path_dbg |= 0x00000002
                 reupload_next = next(iter(self._reupload_pending))
                 self._reupload_pending.pop(reupload_next)
                 self._reuploaded_unacked[reupload_next] = None
-                reupload_now = [reupload_next]
+                reupload_now.append(reupload_next)
         # This case is likely in testing (which explicitly generates
         # the awaiting_setup state), but unlikely in the real works, since
         # unless we have many subscriptions we will get one suback for all of
@@ -0,0 +1,118 @@
+import asyncio
+import math
+import typing
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from gwproactor.links.timer_interface import TimerManagerInterface
+
+DEFAULT_TICK_SECONDS = 0.1
+DEFAULT_NUM_BUCKETS = 512
+
+
+@dataclass(slots=True, eq=False)
+class _WheelTimer:
+    bucket: int
+    rounds: int
+    callback: Callable[[], None]
+
+
+class TimingWheelTimerManager(TimerManagerInterface):
+    """Timer manager for many coarse-grained timers, such as ack timeouts.
+
+    Timers are kept in a hashed timing wheel of num_buckets buckets, one per tick. Starting and cancelling a timer are
+    O(1) set operations and do not touch the event loop's scheduled-callback heap. A single loop timer advances the
+    wheel by one bucket per tick, and only while timers are pending. Timers whose delay is longer than one revolution
+    of the wheel wait an extra revolution per num_buckets ticks.
+
+    Callbacks run on the event loop thread, never before delay_seconds and, unless the loop is running late, within
+    two ticks after it.
+    """
+
+    _tick_seconds: float
+    _buckets: list[set[_WheelTimer]]
+    _cursor: int
+    _num_timers: int
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _tick_handle: Optional[asyncio.TimerHandle] = None
+    _next_tick_time: float = 0.0
+
+    def __init__(
+        self,
+        tick_seconds: float = DEFAULT_TICK_SECONDS,
+        num_buckets: int = DEFAULT_NUM_BUCKETS,
+    ) -> None:
+        if tick_seconds <= 0 or num_buckets < 1:
+            raise ValueError(
+                "ERROR. TimingWheelTimerManager requires tick_seconds > 0 and num_buckets >= 1. "
+                f"Got tick_seconds: {tick_seconds}  num_buckets: {num_buckets}"
+            )
+        self._tick_seconds = tick_seconds
+        self._buckets = [set() for _ in range(num_buckets)]
+        self._cursor = 0
+        self._num_timers = 0
+
+    def start_timer(
+        self, delay_seconds: float, callback: Callable[[], None]
+    ) -> _WheelTimer:
+        num_buckets = len(self._buckets)
+        if self._tick_handle is None:
+            # The wheel is idle, so its first tick will be scheduled a whole tick from now.
+            ticks = max(1, math.ceil(delay_seconds / self._tick_seconds))
+        else:
+            # The next tick may be less than a whole tick away, so count from the tick after it. Ticks are
+            # scheduled at fixed times, so if the next tick is overdue the ones after it come early; wait that
+            # much longer.
+            overdue = max(0.0, asyncio.get_running_loop().time() - self._next_tick_time)
+            ticks = math.ceil((delay_seconds + overdue) / self._tick_seconds) + 1
+        timer = _WheelTimer(
+            bucket=(self._cursor + ticks) % num_buckets,
+            rounds=(ticks - 1) // num_buckets,
+            callback=callback,
+        )
+        self._buckets[timer.bucket].add(timer)
+        self._num_timers += 1
+        if self._tick_handle is None:
+            self._loop = asyncio.get_running_loop()
+            self._next_tick_time = self._loop.time() + self._tick_seconds
+            self._tick_handle = self._loop.call_at(self._next_tick_time, self._tick)
+        return timer
+
+    def cancel_timer(self, timer_handle: Any) -> None:
+        timer = typing.cast(_WheelTimer, timer_handle)
+        bucket = self._buckets[timer.bucket]
+        if timer in bucket:
+            bucket.remove(timer)
+            self._num_timers -= 1
+
+    def num_pending(self) -> int:
+        return self._num_timers
+
+    def _tick(self) -> None:
+        self._cursor = (self._cursor + 1) % len(self._buckets)
+        bucket = self._buckets[self._cursor]
+        expired = []
+        for timer in bucket:
+            if timer.rounds:
+                timer.rounds -= 1
+            else:
+                expired.append(timer)
+        bucket.difference_update(expired)
+        self._num_timers -= len(expired)
+        # Reschedule before running callbacks, which may start or cancel timers.
+        if self._num_timers and self._loop is not None:
+            self._next_tick_time += self._tick_seconds
+            self._tick_handle = self._loop.call_at(self._next_tick_time, self._tick)
+        else:
+            self._tick_handle = None
+        for timer in expired:
+            try:
+                timer.callback()
+            except Exception as e:  # noqa: BLE001, PERF203
+                if self._loop is not None:
+                    self._loop.call_exception_handler(
+                        {
+                            "message": "Exception in TimingWheelTimerManager callback",
+                            "exception": e,
+                        }
+                    )
@@ -7,6 +7,7 @@ import traceback
 import uuid
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     NoReturn,
@@ -34,9 +35,9 @@ from gwproactor.external_watchdog import (
 from gwproactor.io_loop import IOLoop
 from gwproactor.links import (
     AckWaitInfo,
-    AsyncioTimerManager,
     LinkManager,
     LinkManagerTransition,
+    TimingWheelTimerManager,
     Transition,
 )
 from gwproactor.logger import ProactorLogger
@@ -82,6 +83,7 @@ class Proactor(ServicesInterface, Runnable):
     _reindex_problems: Optional[Problems] = None
     _loop: Optional[asyncio.AbstractEventLoop] = None
     _receive_queue: Optional[asyncio.Queue] = None
+    _call_soon_threadsafe: Optional[Callable[..., asyncio.Handle]] = None
     _links: LinkManager
     _communicators: Dict[str, CommunicatorInterface]
     _stop_requested: bool
@@ -134,7 +136,7 @@ class Proactor(ServicesInterface, Runnable):
             logger=self._logger,
             stats=self._stats,
             event_persister=self._event_persister,
-            timer_manager=AsyncioTimerManager(),
+            timer_manager=TimingWheelTimerManager(),
             ack_timeout_callback=self._process_ack_timeout,
         )
         self._communicators = {}
@@ -164,7 +166,9 @@ class Proactor(ServicesInterface, Runnable):
         return StubPersister()
 
     def send(self, message: Message) -> None:
-        if not isinstance(message.Payload, PatWatchdog):
+        if self._logger.message_summary_enabled and not isinstance(
+            message.Payload, PatWatchdog
+        ):
             self._logger.message_summary(
                 direction="OUT internal",
                 src=message.Header.Src,
@@ -176,7 +180,14 @@ class Proactor(ServicesInterface, Runnable):
         self._receive_queue.put_nowait(message)
 
     def send_threadsafe(self, message: Message) -> None:
-        self._loop.call_soon_threadsafe(self._receive_queue.put_nowait, message)
+        self._call_soon_threadsafe(self._receive_queue.put_nowait, message)
+
+    def send_threadsafe_batch(self, messages: Sequence[Message]) -> None:
+        self._call_soon_threadsafe(self._put_nowait_batch, list(messages))
+
+    def _put_nowait_batch(self, messages: list[Message]) -> None:
+        for message in messages:
+            self._receive_queue.put_nowait(message)
 
     def get_communicator(self, name: str) -> Optional[CommunicatorInterface]:
         return self._communicators.get(name, None)
@@ -442,7 +453,9 @@ class Proactor(ServicesInterface, Runnable):
                 message.Header.MessageType,
             )
         path_dbg = 0
-        if not isinstance(message.Payload, (MQTTReceiptPayload, PatWatchdog)):
+        if self._logger.message_summary_enabled and not isinstance(
+            message.Payload, (MQTTReceiptPayload, PatWatchdog)
+        ):
             path_dbg |= 0x00000001
             self._logger.message_summary(
                 direction="IN  internal",
@@ -679,6 +692,7 @@ class Proactor(ServicesInterface, Runnable):
 
     def _start(self) -> None:
         self._loop = asyncio.get_running_loop()
+        self._call_soon_threadsafe = self._loop.call_soon_threadsafe
         self._receive_queue = asyncio.Queue()
         self._links.start(self._loop, self._receive_queue)
         if self._reindex_problems is not None:
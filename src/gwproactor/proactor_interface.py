@@ -194,6 +194,12 @@ class ServicesInterface(CommunicatorInterface):
     def send_threadsafe(self, message: Message) -> None:
         raise NotImplementedError
 
+    def send_threadsafe_batch(self, messages: Sequence[Message]) -> None:
+        """Thread-safe send of multiple messages. This default sends them one at a time with send_threadsafe();
+        implementations may override it to use one wakeup of the event loop for all of them."""
+        for message in messages:
+            self.send_threadsafe(message)
+
     @abstractmethod
     def add_task(self, task: asyncio.Task) -> None:
         raise NotImplementedError
@@ -1,6 +1,7 @@
 """Classes providing interaction between synchronous and asynchronous code"""
 
 import asyncio
+import math
 import queue
 import threading
 import time
@@ -140,7 +141,7 @@ class SyncAsyncInteractionThread(threading.Thread, ABC):
     _iterate_sleep_seconds: Optional[float]
     _responsive_sleep_step_seconds: float
     pat_timeout: Optional[float]
-    _last_pat_time: float
+    _next_pat_deadline: float
 
     def __init__(  # noqa: PLR0913
         self,
@@ -161,7 +162,7 @@ class SyncAsyncInteractionThread(threading.Thread, ABC):
         self._responsive_sleep_step_seconds = responsive_sleep_step_seconds
         self.running = None
         self.pat_timeout = pat_timeout
-        self._last_pat_time = 0.0
+        self._next_pat_deadline = 0.0
 
     def _preiterate(self) -> None:
         pass
@@ -200,7 +201,7 @@ class SyncAsyncInteractionThread(threading.Thread, ABC):
     def run(self) -> None:  # noqa: C901
         if self.running is None:  # noqa: PLR1702
             self.running = True
-            self._last_pat_time = time.time()
+            self._update_next_pat_deadline()
             self._preiterate()
             while self.running:
                 try:
@@ -244,11 +245,17 @@ class SyncAsyncInteractionThread(threading.Thread, ABC):
                             InternalShutdownMessage(Src=self.name, Reason=reason)
                         )
 
+    def _update_next_pat_deadline(self) -> None:
+        if self.pat_timeout is None:
+            self._next_pat_deadline = math.inf
+        else:
+            self._next_pat_deadline = time.monotonic() + self.pat_timeout / 2
+
     def time_to_pat(self) -> bool:
-        return time.time() >= (self._last_pat_time + (self.pat_timeout / 2))
+        return time.monotonic() >= self._next_pat_deadline
 
     def pat_watchdog(self) -> None:
-        self._last_pat_time = time.time()
+        self._update_next_pat_deadline()
         self._put_to_async_queue(PatInternalWatchdogMessage(src=self.name))
 
     async def async_join(self, timeout: Optional[float] = None) -> None:  # noqa: ASYNC109
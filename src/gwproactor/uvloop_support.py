@@ -0,0 +1,46 @@
+"""Optional support for running proactors on uvloop (https://github.com/MagicStack/uvloop).
+
+uvloop is not a required dependency. It can be installed with the 'uvloop' extra. If it is not installed, or if
+the platform is Windows (which uvloop does not support), these functions fall back to the stock asyncio event loop.
+"""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+except ImportError:
+    _UVLOOP_INSTALLED = False
+else:
+    _UVLOOP_INSTALLED = True
+
+
+def uvloop_available() -> bool:
+    return _UVLOOP_INSTALLED and sys.platform != "win32"
+
+
+def install_uvloop_policy() -> bool:
+    """Make uvloop the default event loop policy for this process, if uvloop is available.
+
+    Meant to be called once at process start, before any event loop is created, e.g. by a command line entry point
+    before calling asyncio.run().
+
+    Returns:
+        True if the uvloop policy was installed.
+    """
+    if uvloop_available():
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+    return False
+
+
+def new_event_loop(*, use_uvloop: bool = True) -> asyncio.AbstractEventLoop:
+    """Create a new event loop, using uvloop if requested and available.
+
+    Unlike install_uvloop_policy(), this does not change the process-wide event loop policy, so it is suitable for
+    loops which are created and run on a separate thread.
+    """
+    if use_uvloop and uvloop_available():
+        loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+        return loop
+    return asyncio.new_event_loop()
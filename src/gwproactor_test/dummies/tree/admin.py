@@ -151,7 +151,7 @@ class MQTTAdmin:
     def on_message(self, _: Any, _userdata: Any, message: MQTTMessage) -> None:
         if not self.json:
             rich.print(f"Received <{message.topic}>  in state <{self.state}>")
-        msg_type = message.topic.split("/")[-1].replace("-", ".")
+        msg_type = message.topic.rpartition("/")[2].replace("-", ".")
         if (
             self.state == AppState.awaiting_command_ack
             and msg_type == Ack.model_fields["TypeName"].default
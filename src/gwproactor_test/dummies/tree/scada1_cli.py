@@ -6,6 +6,7 @@ from gwproactor.command_line_utils import (
     print_settings,
     run_async_main,
 )
+from gwproactor.uvloop_support import install_uvloop_policy
 from gwproactor_test.dummies import DUMMY_SCADA1_NAME
 from gwproactor_test.dummies.tree.scada1 import DummyScada1
 from gwproactor_test.dummies.tree.scada1_settings import DummyScada1Settings
@@ -25,6 +26,7 @@ def run(
     verbose: bool = False,
     message_summary: bool = False,
 ) -> None:
+    install_uvloop_policy()
     asyncio.run(
         run_async_main(
             name=DUMMY_SCADA1_NAME,
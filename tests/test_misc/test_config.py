@@ -3,15 +3,15 @@
 import shutil
 import ssl
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Union
 
 import pytest
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr
 
-from gwproactor.config import MQTTClient, Paths
-from gwproactor.config.mqtt import TLSInfo
+from gwproactor.config import MQTTClient, Paths, ProactorSettings
+from gwproactor.config.mqtt import TLSInfo, mqtt_field_names
 from gwproactor.config.paths import TLSPaths
-from gwproactor_test.dummies import DummyChildSettings
+from gwproactor_test.dummies import DummyChildSettings, DummyParentSettings
 
 
 def test_tls_paths() -> None:
@@ -206,8 +206,47 @@ def assert_paths(paths: Paths, **kwargs: Any) -> None:
     assert paths.model_dump() == exp
 
 
+def test_mqtt_field_names() -> None:
+    class Model(BaseModel):
+        a: MQTTClient = MQTTClient()
+        b: int = 0
+        c: Optional[MQTTClient] = None
+        d: str = ""
+
+    assert mqtt_field_names(Model) == ("a", "c")
+    assert mqtt_field_names(DummyChildSettings) == ("parent_mqtt",)
+    assert mqtt_field_names(DummyParentSettings) == ("child_mqtt",)
+    assert mqtt_field_names(TLSInfo) == ()
+
+
+def test_mqtt_clients_in_loosely_annotated_fields(clean_test_env: Any) -> None:
+    class Settings(ProactorSettings):
+        any_mqtt: Any = MQTTClient()
+        base_mqtt: BaseModel = MQTTClient()
+        union_mqtt: Union[int, BaseModel] = MQTTClient()
+        not_mqtt: Any = 1
+
+    assert set(mqtt_field_names(Settings)) == {
+        "any_mqtt",
+        "base_mqtt",
+        "union_mqtt",
+        "not_mqtt",
+    }
+    settings = Settings()
+    for field_name in ["any_mqtt", "base_mqtt", "union_mqtt"]:
+        client = getattr(settings, field_name)
+        assert isinstance(client, MQTTClient)
+        assert client.tls.paths.ca_cert_path == (
+            settings.paths.certs_dir / field_name / "ca.crt"
+        )
+
+
 def test_paths_defaults(clean_test_env: Any, tmp_path: Path) -> None:
     assert_paths(Paths(), home=tmp_path)
+    paths = Paths.defaults()
+    assert_paths(paths, home=tmp_path)
+    assert paths == Paths()
+    assert not paths.model_fields_set
 
 
 def test_paths(clean_test_env: Any, tmp_path: Path) -> None:
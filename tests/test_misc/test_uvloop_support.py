@@ -0,0 +1,37 @@
+"""Test optional uvloop support"""
+
+import asyncio
+
+from gwproactor.uvloop_support import (
+    install_uvloop_policy,
+    new_event_loop,
+    uvloop_available,
+)
+
+
+def test_install_uvloop_policy() -> None:
+    original_policy = asyncio.get_event_loop_policy()
+    try:
+        installed = install_uvloop_policy()
+        assert installed == uvloop_available()
+        policy = asyncio.get_event_loop_policy()
+        if installed:
+            assert policy is not original_policy
+            assert type(policy).__module__.startswith("uvloop")
+        else:
+            assert policy is original_policy
+    finally:
+        asyncio.set_event_loop_policy(original_policy)
+
+
+def test_new_event_loop() -> None:
+    original_policy = asyncio.get_event_loop_policy()
+    for use_uvloop in [True, False]:
+        loop = new_event_loop(use_uvloop=use_uvloop)
+        try:
+            assert type(loop).__module__.startswith("uvloop") == (
+                use_uvloop and uvloop_available()
+            )
+        finally:
+            loop.close()
+    assert asyncio.get_event_loop_policy() is original_policy
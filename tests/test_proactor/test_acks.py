@@ -0,0 +1,60 @@
+# ruff: noqa: PLR2004
+"""Test AckManager"""
+
+import pytest
+
+from gwproactor import Proactor, ProactorSettings
+from gwproactor.links import AckManager, AckWaitInfo, TimingWheelTimerManager
+
+# Long enough that the wheel's own loop timer never fires during a test; the tests advance the wheel by calling
+# _tick() directly.
+TICK = 1000.0
+
+
+@pytest.mark.asyncio
+async def test_cancel_ack_timers() -> None:
+    timer_mgr = TimingWheelTimerManager(tick_seconds=TICK)
+    timeouts: list[AckWaitInfo] = []
+    acks = AckManager(timer_mgr, timeouts.append, delay=TICK)
+    acks.add_link("a")
+    acks.add_link("b")
+    wait_infos = [acks.start_ack_timer("a", str(i)) for i in range(3)]
+    acks.start_ack_timer("b", "x")
+    assert acks.num_acks("a") == 3
+    canceled = acks.cancel_ack_timers("a")
+    assert canceled == wait_infos
+    assert acks.num_acks("a") == 0
+    assert acks.cancel_ack_timers("a") == []
+    assert acks.cancel_ack_timers("unknown") == []
+    assert timer_mgr.num_pending() == 1
+    # "x" was started after the wheel started running, so it waits for one more tick.
+    timer_mgr._tick()  # noqa: SLF001
+    assert timeouts == []
+    timer_mgr._tick()  # noqa: SLF001
+    assert [wait_info.message_id for wait_info in timeouts] == ["x"]
+    assert acks.num_acks("b") == 0
+
+
+class _AckTimeoutRecorder(Proactor):
+    ack_timeouts: list[AckWaitInfo]
+
+    def __init__(self) -> None:
+        super().__init__("ack-timeout-recorder", ProactorSettings())
+        self.ack_timeouts = []
+
+    def _process_ack_timeout(self, wait_info: AckWaitInfo) -> None:
+        self.ack_timeouts.append(wait_info)
+
+
+@pytest.mark.asyncio
+async def test_proactor_ack_timeout() -> None:
+    proactor = _AckTimeoutRecorder()
+    acks = proactor.links.ack_manager
+    timer_mgr = acks._timer_mgr  # noqa: SLF001
+    assert isinstance(timer_mgr, TimingWheelTimerManager)
+    acks.add_link("l")
+    wait_info = acks.start_ack_timer("l", "m", delay_seconds=0)
+    assert timer_mgr.num_pending() == 1
+    timer_mgr._tick()  # noqa: SLF001
+    assert proactor.ack_timeouts == [wait_info]
+    assert acks.num_acks("l") == 0
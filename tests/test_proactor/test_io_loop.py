@@ -0,0 +1,130 @@
+"""Test IOLoop without a broker"""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+from gwproto import Message
+from gwproto.messages import ProblemEvent
+
+from gwproactor import Proactor, ProactorSettings
+from gwproactor.io_loop import COMPLETED_TASK_HISTORY, IOLoop
+from gwproactor.message import PatInternalWatchdog, Shutdown
+from gwproactor.proactor_interface import INVALID_IO_TASK_HANDLE
+
+TIMEOUT_SECONDS = 5
+
+
+class _IOLoopHarness:
+    """An IOLoop whose messages to its Proactor are collected on the test's event loop."""
+
+    proactor: Proactor
+    io_loop: IOLoop
+    received: asyncio.Queue
+
+    def __init__(self) -> None:
+        self.proactor = Proactor("io-loop-test", ProactorSettings())
+        io_loop = self.proactor.io_loop_manager
+        assert isinstance(io_loop, IOLoop)
+        self.io_loop = io_loop
+        self.received = asyncio.Queue()
+        self.proactor._call_soon_threadsafe = (  # noqa: SLF001
+            asyncio.get_running_loop().call_soon_threadsafe
+        )
+        self.proactor._receive_queue = self.received  # noqa: SLF001
+
+    async def next_message(self) -> Message[Any]:
+        """The next message sent to the Proactor, skipping watchdog pats."""
+        while True:
+            message = await asyncio.wait_for(
+                self.received.get(), timeout=TIMEOUT_SECONDS
+            )
+            if not isinstance(message.Payload, PatInternalWatchdog):
+                return message
+
+    async def join_thread(self) -> None:
+        thread = self.io_loop._io_thread  # noqa: SLF001
+        assert thread is not None
+        await asyncio.to_thread(thread.join, TIMEOUT_SECONDS)
+        assert not thread.is_alive()
+
+
+async def _wait(event: threading.Event) -> None:
+    assert await asyncio.to_thread(event.wait, TIMEOUT_SECONDS)
+
+
+@pytest.mark.asyncio
+async def test_io_loop_add_cancel_stop() -> None:
+    harness = _IOLoopHarness()
+    io_loop = harness.io_loop
+    io_loop.start()
+
+    # The internal watchdog is patted as soon as the loop runs.
+    pat = await asyncio.wait_for(harness.received.get(), timeout=TIMEOUT_SECONDS)
+    assert isinstance(pat.Payload, PatInternalWatchdog)
+
+    completed = threading.Event()
+
+    async def complete() -> None:
+        completed.set()
+
+    completed_id = io_loop.add_io_coroutine(complete(), name="complete")
+    assert completed_id != INVALID_IO_TASK_HANDLE
+    await _wait(completed)
+
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    async def wait_forever() -> None:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    forever_id = io_loop.add_io_coroutine(wait_forever())
+    assert forever_id not in {completed_id, INVALID_IO_TASK_HANDLE}
+    await _wait(started)
+    io_loop.cancel_io_routine(forever_id)
+    await _wait(cancelled)
+
+    # Neither a completed nor a cancelled task is an error.
+    io_loop.stop()
+    await io_loop.join()
+    await harness.join_thread()
+    assert io_loop._errors == []  # noqa: SLF001
+    assert io_loop._tasks == {}  # noqa: SLF001
+    assert io_loop._completed_tasks.maxlen == COMPLETED_TASK_HISTORY  # noqa: SLF001
+    completed_tasks = dict(io_loop._completed_tasks)  # noqa: SLF001
+    assert completed_tasks[completed_id].get_name() == "complete"
+    assert completed_tasks[completed_id].done()
+    # No tasks can be added once stopped.
+    coro = complete()
+    assert io_loop.add_io_coroutine(coro) == INVALID_IO_TASK_HANDLE
+    coro.close()
+
+
+@pytest.mark.asyncio
+async def test_io_loop_task_error() -> None:
+    harness = _IOLoopHarness()
+    io_loop = harness.io_loop
+    io_loop.start()
+
+    async def fail() -> None:
+        raise ValueError("io task failed")
+
+    io_loop.add_io_coroutine(fail())
+
+    # A failed task stops the IOLoop, which reports a Problem and requests Shutdown.
+    problem = await harness.next_message()
+    assert isinstance(problem.Payload, ProblemEvent)
+    assert problem.Payload.Src == io_loop.name
+    assert "io task failed" in problem.Payload.Details
+    shutdown = await harness.next_message()
+    assert isinstance(shutdown.Payload, Shutdown)
+    assert shutdown.Payload.Reason == problem.Payload.Summary
+    await harness.join_thread()
+    assert len(io_loop._errors) == 1  # noqa: SLF001
+    assert isinstance(io_loop._errors[0], ValueError)  # noqa: SLF001
@@ -0,0 +1,28 @@
+"""Test LinkMessageTimes"""
+
+import time
+
+from gwproactor.links import LinkMessageTimes
+
+# Allowed difference between a reported wall-clock time and time.time() read in the test.
+WALL_CLOCK_TOLERANCE_SECONDS = 5.0
+
+
+def test_link_message_times_wall_clock_str() -> None:
+    times = LinkMessageTimes()
+    fields = dict(
+        entry.split(":", 1) for entry in times.get_str(relative=False).split()
+    )
+    wall_now = time.time()
+    assert abs(float(fields["ls"]) - wall_now) < WALL_CLOCK_TOLERANCE_SECONDS
+    # snp and nps are both the wall-clock time of the next ping, formatted to 2 decimals.
+    assert fields["snp"] == fields["nps"]
+
+
+def test_link_message_times_wall_clock() -> None:
+    times = LinkMessageTimes()
+    wall_now = time.time()
+    assert abs(times.last_send_wall - wall_now) < WALL_CLOCK_TOLERANCE_SECONDS
+    assert abs(times.last_recv_wall - wall_now) < WALL_CLOCK_TOLERANCE_SECONDS
+    times.last_send += 10
+    assert abs(times.last_send_wall - 10 - wall_now) < WALL_CLOCK_TOLERANCE_SECONDS
@@ -0,0 +1,204 @@
+"""Test RESTPoller"""
+
+import asyncio
+import contextlib
+import threading
+from typing import Any, Optional
+
+import pytest
+from aiohttp import ClientTimeout, test_utils, web
+from gwproto import Message
+from gwproto.messages import ProblemEvent
+from gwproto.type_helpers import AioHttpClientTimeout, RESTPollerSettings
+
+from gwproactor import Proactor, ProactorSettings
+from gwproactor.actors.rest import BytesConverter, RESTPoller
+from gwproactor.message import PatInternalWatchdogMessage
+
+
+def _rest_settings(**kwargs: Any) -> RESTPollerSettings:
+    return RESTPollerSettings.model_validate(
+        dict(
+            {
+                "session": {},
+                "request": {"url": {"url": "http://127.0.0.1:8080/status"}},
+            },
+            **kwargs,
+        )
+    )
+
+
+def _poller(rest: RESTPollerSettings, **kwargs: Any) -> RESTPoller:
+    return RESTPoller(
+        "poller",
+        rest,
+        Proactor("proactor", ProactorSettings()).io_loop_manager,
+        **kwargs,
+    )
+
+
+def test_rest_poller_request_args() -> None:
+    rest = _rest_settings()
+    rest.request.headers = {"h": "1"}
+    cached = _poller(rest)
+    uncached = _poller(rest, cache_request_args=False)
+
+    # Settings changed after construction are only seen without cache_request_args.
+    rest.request.headers = {"h": "2"}
+    rest.session.timeout = AioHttpClientTimeout(total=5)
+    for args in [cached._request_args, cached._make_request_args()]:  # noqa: SLF001
+        assert args is not None
+        assert args.kwargs["headers"] == {"h": "1"}
+    assert cached._make_session_args().kwargs["timeout"] is None  # noqa: SLF001
+    assert uncached._request_args is None  # noqa: SLF001
+    assert uncached._make_request_args().kwargs["headers"] == {"h": "2"}  # noqa: SLF001
+    assert uncached._make_session_args().kwargs["timeout"] == ClientTimeout(  # noqa: SLF001
+        total=5
+    )
+
+
+def test_rest_poller_batch_args() -> None:
+    rest = _rest_settings(poll_period_seconds=1.0)
+    batches: list[list[Message]] = []
+    with pytest.raises(ValueError):
+        _poller(rest, forward_batch=batches.append, batch_size=3)
+    with pytest.raises(ValueError):
+        _poller(
+            rest, forward_batch=batches.append, batch_size=3, batch_max_delay_seconds=2
+        )
+    # No batching without a batch forwarder or with batch_size 1, so no delay is needed.
+    assert _poller(rest, batch_size=3)._forward_batch is None  # noqa: SLF001
+    assert _poller(rest, forward_batch=batches.append)._forward_batch is None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_rest_poller_forward_batch() -> None:
+    forwarded: list[Message] = []
+    batches: list[list[Message]] = []
+    poller = _poller(
+        _rest_settings(poll_period_seconds=1.0),
+        forward=forwarded.append,
+        forward_batch=batches.append,
+        batch_size=3,
+        batch_max_delay_seconds=2.5,
+    )
+    messages = [PatInternalWatchdogMessage(src=str(i)) for i in range(4)]
+    for message in messages:
+        poller._forward_message(message)  # noqa: SLF001
+    assert batches == [messages[:3]]
+    assert poller._pending == messages[3:]  # noqa: SLF001
+    assert poller._flush_handle is not None  # noqa: SLF001
+    poller._flush_pending()  # noqa: SLF001
+    assert batches == [messages[:3], messages[3:]]
+    assert poller._flush_handle is None  # noqa: SLF001
+    poller._flush_pending()  # noqa: SLF001
+    assert len(batches) == 2  # noqa: PLR2004
+    assert not forwarded
+
+
+@pytest.mark.asyncio
+async def test_rest_poller_batch_flush_timer() -> None:
+    flushed = asyncio.Event()
+    batches: list[list[Message]] = []
+
+    def forward_batch(messages: list[Message]) -> None:
+        batches.append(messages)
+        flushed.set()
+
+    poller = _poller(
+        _rest_settings(poll_period_seconds=0.001),
+        forward_batch=forward_batch,
+        batch_size=2,
+        batch_max_delay_seconds=0.01,
+    )
+    message = PatInternalWatchdogMessage(src="a")
+    poller._forward_message(message)  # noqa: SLF001
+    assert not batches
+    # The flush timer forwards an incomplete batch without waiting for another poll.
+    await asyncio.wait_for(flushed.wait(), timeout=5)
+    assert batches == [[message]]
+    assert poller._flush_handle is None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_proactor_send_threadsafe_batch() -> None:
+    proactor = Proactor("proactor", ProactorSettings())
+    proactor._call_soon_threadsafe = asyncio.get_running_loop().call_soon_threadsafe  # noqa: SLF001
+    queue: asyncio.Queue = asyncio.Queue()
+    proactor._receive_queue = queue  # noqa: SLF001
+    messages = [PatInternalWatchdogMessage(src=str(i)) for i in range(3)]
+    thread = threading.Thread(target=proactor.send_threadsafe_batch, args=(messages,))
+    thread.start()
+    thread.join()
+    received = [await asyncio.wait_for(queue.get(), timeout=5) for _ in messages]
+    assert received == messages
+
+
+@pytest.mark.asyncio
+async def test_rest_poller_keepalive_timeout() -> None:
+    for poll_period_seconds, keepalive_timeout in [
+        (1.0, 1.0 + RESTPoller.KEEPALIVE_MARGIN_SECONDS),
+        (600.0, RESTPoller.MAX_KEEPALIVE_SECONDS),
+    ]:
+        poller = _poller(_rest_settings(poll_period_seconds=poll_period_seconds))
+        connector = poller._make_connector()  # noqa: SLF001
+        try:
+            assert connector._keepalive_timeout == keepalive_timeout  # noqa: SLF001
+        finally:
+            await connector.close()
+
+
+async def _poll_once(body: bytes, convert_bytes: BytesConverter) -> list[Message]:
+    """Run a RESTPoller against a local server returning body until it forwards a message."""
+    forwarded: list[Message] = []
+    received = asyncio.Event()
+
+    def forward(message: Message) -> None:
+        forwarded.append(message)
+        received.set()
+
+    async def handler(_request: web.Request) -> web.Response:
+        return web.Response(body=body)
+
+    app = web.Application()
+    app.router.add_get("/status", handler)
+    async with test_utils.TestServer(app) as server:
+        poller = _poller(
+            _rest_settings(request={"url": {"url": str(server.make_url("/status"))}}),
+            forward=forward,
+            convert_bytes=convert_bytes,
+        )
+        task = asyncio.create_task(poller._run())  # noqa: SLF001
+        try:
+            await asyncio.wait_for(received.wait(), timeout=5)
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    return forwarded
+
+
+@pytest.mark.asyncio
+async def test_rest_poller_convert_bytes() -> None:
+    bodies: list[bytes] = []
+
+    async def convert_bytes(body: bytes) -> Optional[Message]:
+        bodies.append(body)
+        return PatInternalWatchdogMessage(src=body.decode())
+
+    forwarded = await _poll_once(b"canned", convert_bytes)
+    assert bodies == [b"canned"]
+    assert [message.Header.Src for message in forwarded] == ["canned"]
+
+
+@pytest.mark.asyncio
+async def test_rest_poller_convert_bytes_error() -> None:
+    async def convert_bytes(body: bytes) -> Optional[Message]:
+        raise ValueError(body.decode())
+
+    forwarded = await _poll_once(b"unconvertible", convert_bytes)
+    assert len(forwarded) == 1
+    problem = forwarded[0].Payload
+    assert isinstance(problem, ProblemEvent)
+    assert problem.Summary.startswith("Convert error for <poller>")
+    assert "unconvertible" in problem.Details
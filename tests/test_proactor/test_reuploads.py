@@ -0,0 +1,34 @@
+# ruff: noqa: PLR2004
+"""Test Reuploads"""
+
+from gwproactor import ProactorLogger, ProactorSettings
+from gwproactor.links import Reuploads
+from gwproactor.stats import LinkStats
+
+
+def test_reupload_window_refill() -> None:
+    logger = ProactorLogger(**ProactorSettings().logging.qualified_logger_names())
+    reuploads = Reuploads(logger, num_initial_events=3)
+    reuploads.stats = LinkStats("upstream")
+    event_ids = [str(i) for i in range(8)]
+    assert reuploads.start_reupload(event_ids) == ["0", "1", "2"]
+
+    # One ack, one event sent.
+    assert reuploads.process_ack_for_reupload("0") == ["3"]
+    assert reuploads.num_reuploaded_unacked == 3
+
+    # An event dropped from the window (e.g. undecodable) is made up on the next ack.
+    reuploads.clear_unacked_event("1")
+    assert reuploads.num_reuploaded_unacked == 2
+    assert reuploads.process_ack_for_reupload("2") == ["4", "5"]
+    assert reuploads.num_reuploaded_unacked == 3
+    assert reuploads.num_reupload_pending == 2
+
+    # Ack for an event that has not been sent yet.
+    assert reuploads.process_ack_for_reupload("7") == []
+    assert reuploads.num_reupload_pending == 1
+
+    for ack_id in ["3", "4", "5", "6"]:
+        reuploads.process_ack_for_reupload(ack_id)
+    assert not reuploads.reuploading()
+    assert reuploads.stats.reupload_counts.completed == 1
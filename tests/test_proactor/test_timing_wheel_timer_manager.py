@@ -0,0 +1,135 @@
+# ruff: noqa: PLR2004
+"""Test TimingWheelTimerManager"""
+
+import asyncio
+import functools
+import time
+from typing import Any
+
+import pytest
+
+from gwproactor.links import TimingWheelTimerManager
+
+# Long enough that the wheel's own loop timer never fires during a test; the tests advance the wheel by calling
+# _tick() directly.
+TICK = 1000.0
+
+
+def _advance(mgr: TimingWheelTimerManager, ticks: int) -> None:
+    for _ in range(ticks):
+        mgr._tick()  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_timing_wheel_timer_manager() -> None:
+    mgr = TimingWheelTimerManager(tick_seconds=TICK, num_buckets=8)
+    fired: list[str] = []
+    # Started while the wheel is idle, so the first tick is a whole tick away.
+    mgr.start_timer(3 * TICK, functools.partial(fired.append, "a"))
+    # Started while the wheel is running, so they wait for one more tick. "b" is longer than one revolution of the
+    # wheel.
+    mgr.start_timer(20 * TICK, functools.partial(fired.append, "b"))
+    cancelled = mgr.start_timer(2 * TICK, functools.partial(fired.append, "c"))
+    mgr.start_timer(0, functools.partial(fired.append, "d"))
+    assert mgr.num_pending() == 4
+    mgr.cancel_timer(cancelled)
+    mgr.cancel_timer(cancelled)
+    assert mgr.num_pending() == 3
+
+    _advance(mgr, 1)
+    assert fired == ["d"]
+    _advance(mgr, 2)
+    assert fired == ["d", "a"]
+    _advance(mgr, 17)
+    assert fired == ["d", "a"]
+    assert mgr.num_pending() == 1
+    _advance(mgr, 1)
+    assert fired == ["d", "a", "b"]
+    assert mgr.num_pending() == 0
+    assert mgr._tick_handle is None  # noqa: SLF001
+
+    # Wheel restarts after going idle; callbacks may start timers.
+    def _restart(name: str) -> None:
+        fired.append(name)
+        if name == "e":
+            mgr.start_timer(TICK, functools.partial(_restart, "f"))
+
+    mgr.start_timer(TICK, functools.partial(_restart, "e"))
+    assert mgr._tick_handle is not None  # noqa: SLF001
+    _advance(mgr, 1)
+    assert fired[-1] == "e"
+    assert mgr.num_pending() == 1
+    _advance(mgr, 1)
+    assert fired[-1] == "f"
+    assert mgr.num_pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_timing_wheel_timer_manager_callback_exception() -> None:
+    loop = asyncio.get_running_loop()
+    contexts: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _loop, context: contexts.append(context))
+    mgr = TimingWheelTimerManager(tick_seconds=TICK)
+    fired: list[str] = []
+
+    def _raise() -> None:
+        raise ValueError("boom")
+
+    mgr.start_timer(TICK, _raise)
+    mgr.start_timer(0, functools.partial(fired.append, "a"))
+    _advance(mgr, 1)
+    assert fired == ["a"]
+    assert len(contexts) == 1
+    assert isinstance(contexts[0]["exception"], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_timing_wheel_timer_manager_never_early() -> None:
+    mgr = TimingWheelTimerManager(tick_seconds=TICK)
+    fired: list[str] = []
+    mgr.start_timer(10 * TICK, functools.partial(fired.append, "running"))
+    # Started part way through a tick, so the first tick does not count towards the delay.
+    mgr.start_timer(2 * TICK, functools.partial(fired.append, "a"))
+    _advance(mgr, 2)
+    assert fired == []
+    _advance(mgr, 1)
+    assert fired == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_timing_wheel_timer_manager_never_early_on_loop() -> None:
+    tick_seconds = 0.01
+    delay_seconds = 0.05
+    loop = asyncio.get_running_loop()
+    mgr = TimingWheelTimerManager(tick_seconds=tick_seconds)
+    mgr.start_timer(1, lambda: None)
+    started: list[float] = []
+    fired: list[float] = []
+    done = asyncio.Event()
+
+    def _fire() -> None:
+        fired.append(loop.time())
+        if len(fired) == len(started):
+            done.set()
+
+    def _start(block_seconds: float = 0.0) -> None:
+        # Blocking the loop makes the wheel's next tick overdue.
+        time.sleep(block_seconds)
+        started.append(loop.time())
+        mgr.start_timer(delay_seconds, _fire)
+
+    # Start timers at several points within a tick of the already running wheel.
+    for i in range(5):
+        loop.call_later(tick_seconds * (1 + i / 5), _start)
+    loop.call_later(tick_seconds * 2, _start, 3 * tick_seconds)
+    await asyncio.wait_for(done.wait(), timeout=5)
+    assert len(fired) == len(started)
+    for started_at, fired_at in zip(started, fired):
+        assert fired_at - started_at >= delay_seconds
+
+
+def test_timing_wheel_timer_manager_args() -> None:
+    with pytest.raises(ValueError):
+        TimingWheelTimerManager(tick_seconds=0)
+    with pytest.raises(ValueError):
+        TimingWheelTimerManager(num_buckets=0)